@@ -0,0 +1,20 @@
+import os
+import stat
+
+
+def test_write_json_keeps_symlinks_and_permissions(tmp_path):
+    from xespresso.utils.machines.config.loader import read_json, write_json
+
+    target = tmp_path / "dotfiles" / "machines.json"
+    target.parent.mkdir()
+    target.write_text("{}")
+    target.chmod(0o600)
+    link = tmp_path / "machines.json"
+    link.symlink_to(target)
+
+    write_json(str(link), {"machines": {"local": {"execution": "local"}}})
+
+    assert link.is_symlink()
+    assert read_json(str(target)) == {"machines": {"local": {"execution": "local"}}}
+    assert stat.S_IMODE(os.stat(target).st_mode) == 0o600
+    assert sorted(os.listdir(target.parent)) == ["machines.json"]
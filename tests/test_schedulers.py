@@ -0,0 +1,373 @@
+import os
+import subprocess
+import threading
+import time
+
+
+class FakeCalc:
+    """Minimal stand-in for an Espresso calculator."""
+
+    def __init__(self, directory, prefix="test", package="pw"):
+        self.directory = str(directory)
+        self.prefix = prefix
+        self.package = package
+        self.parameters = {"input_data": {"CONTROL": {}}, "pseudopotentials": {}}
+
+
+def _record_runs(monkeypatch):
+    calls = []
+
+    def fake_run(args, **kwargs):
+        calls.append((args, kwargs))
+        return subprocess.CompletedProcess(args, 0)
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    return calls
+
+
+def test_direct_run_execs_bash_job_file(tmp_path):
+    from xespresso.schedulers.direct import DirectScheduler
+
+    scheduler = DirectScheduler(FakeCalc(tmp_path), {"execution": "local"}, "echo ok > ran.txt")
+    scheduler.write_script()
+    assert scheduler.run() == (None, None)
+    assert (tmp_path / "ran.txt").read_text().strip() == "ok"
+
+
+def test_default_submit_commands_are_not_run_through_a_shell(tmp_path, monkeypatch):
+    from xespresso.schedulers.direct import DirectScheduler
+    from xespresso.schedulers.slurm import SlurmScheduler
+
+    calls = _record_runs(monkeypatch)
+    DirectScheduler(FakeCalc(tmp_path), {"execution": "local"}, "pw.x").run()
+    SlurmScheduler(FakeCalc(tmp_path), {"execution": "local"}, "pw.x").run()
+    assert [args for args, _ in calls] == [["bash", "job_file"], ["sbatch", "job_file"]]
+    assert all(not kwargs.get("shell") and kwargs["cwd"] == str(tmp_path) for _, kwargs in calls)
+
+
+def test_submit_command_with_shell_syntax_uses_the_shell(tmp_path, monkeypatch):
+    from xespresso.schedulers.direct import DirectScheduler
+
+    calls = _record_runs(monkeypatch)
+    for command in (
+        "OMP_NUM_THREADS=1 bash job_file",
+        "bash job_file > log 2>&1",
+        "cd . && bash job_file",
+        "bash job_file # rerun",
+        "bash 'job file'",
+    ):
+        scheduler = DirectScheduler(FakeCalc(tmp_path), {"execution": "local"}, "pw.x")
+        scheduler._submit_cmd = command
+        scheduler.run()
+        assert calls[-1][0] == command and calls[-1][1]["shell"] is True
+
+
+def test_missing_submit_executable_raises_called_process_error(tmp_path):
+    import pytest
+    from xespresso.schedulers.direct import DirectScheduler
+
+    scheduler = DirectScheduler(FakeCalc(tmp_path), {"execution": "local"}, "pw.x")
+    scheduler._submit_cmd = "xespresso-no-such-command job_file"
+    with pytest.raises(subprocess.CalledProcessError) as excinfo:
+        scheduler.run()
+    assert excinfo.value.returncode == 127
+
+
+def test_locate_pseudo_flat_and_nested(tmp_path):
+    from xespresso.schedulers.remote_mixin import _locate_pseudo
+
+    first, second = tmp_path / "first", tmp_path / "second"
+    (second / "PBE").mkdir(parents=True)
+    first.mkdir()
+    (first / "H.UPF").write_text("H")
+    (second / "H.UPF").write_text("H, lower priority")
+    (second / "PBE" / "Fe.UPF").write_text("Fe")
+    search_dirs = [str(first), str(second)]
+
+    assert _locate_pseudo("H.UPF", search_dirs) == str(first / "H.UPF")
+    assert _locate_pseudo("PBE/Fe.UPF", search_dirs) == str(second / "PBE" / "Fe.UPF")
+    assert _locate_pseudo("PBE/Missing.UPF", search_dirs) is None
+
+
+def test_locate_pseudo_skips_entries_that_are_not_files(tmp_path):
+    from xespresso.schedulers.remote_mixin import _locate_pseudo
+
+    first, second = tmp_path / "first", tmp_path / "second"
+    (first / "O.UPF").mkdir(parents=True)
+    (first / "N.UPF").symlink_to(tmp_path / "missing.UPF")
+    second.mkdir()
+    (second / "O.UPF").write_text("O")
+    (second / "N.UPF").write_text("N")
+    search_dirs = [str(first), str(second)]
+
+    assert _locate_pseudo("O.UPF", search_dirs) == str(second / "O.UPF")
+    assert _locate_pseudo("N.UPF", search_dirs) == str(second / "N.UPF")
+    assert _locate_pseudo("C.UPF", [str(first)]) is None
+
+
+class FakePseudoRemote:
+    """Records the uploads of _transfer_pseudopotentials()."""
+
+    username, host, port = "user", "cluster", 22
+
+    def __init__(self):
+        self.dirs = set()
+        self.sent = {}
+
+    def makedirs(self, *remote_dirs):
+        self.dirs.update(remote_dirs)
+
+    def stat(self, remote_path):
+        return None
+
+    def has_command(self, name):
+        return False
+
+    def send_file_hashed(self, local_path, remote_path, hasher, confirm=True):
+        with open(local_path, "rb") as f:
+            data = f.read()
+        self.sent[remote_path] = data
+        return hasher(data).hexdigest()
+
+    def checksum_many(self, remote_paths, tool="sha256sum"):
+        import hashlib
+
+        return {path: hashlib.sha256(self.sent[path]).hexdigest() for path in remote_paths}
+
+
+def test_transfer_pseudopotentials_flat_and_nested(tmp_path, monkeypatch):
+    from xespresso.schedulers import remote_mixin
+    from xespresso.schedulers.direct import DirectScheduler
+
+    monkeypatch.setattr(remote_mixin, "PSEUDO_CACHE_PATH", str(tmp_path / "pseudo_cache.json"))
+    pseudo_dir = tmp_path / "pseudo"
+    (pseudo_dir / "PBE").mkdir(parents=True)
+    (pseudo_dir / "H.UPF").write_text("H")
+    (pseudo_dir / "PBE" / "Fe.UPF").write_text("Fe")
+
+    calc = FakeCalc(tmp_path)
+    calc.parameters["pseudopotentials"] = {"H": "H.UPF", "Fe": "PBE/Fe.UPF"}
+    calc.parameters["input_data"]["CONTROL"]["pseudo_dir"] = str(pseudo_dir)
+    calc.atoms = None
+    calc.write_input = lambda atoms: None
+
+    scheduler = DirectScheduler(calc, {"execution": "remote"}, "pw.x")
+    scheduler.remote = FakePseudoRemote()
+    scheduler.remote_path = "/scratch/job"
+    scheduler._transfer_pseudopotentials()
+
+    assert scheduler.remote.sent == {
+        "/scratch/job/pseudo/H.UPF": b"H",
+        "/scratch/job/pseudo/PBE/Fe.UPF": b"Fe",
+    }
+    assert "/scratch/job/pseudo/PBE" in scheduler.remote.dirs
+
+
+class FakeBatchRemote:
+    """RemoteAuth stand-in that runs submissions with the local shell."""
+
+    def __init__(self, host):
+        self.host = host
+        self.commands = []
+        self.retrieved = []
+        self.refs = 0
+
+    def is_active(self):
+        return True
+
+    def release(self):
+        self.refs -= 1
+
+    def run_command(self, command):
+        self.commands.append(command)
+        result = subprocess.run(["bash", "-c", command], capture_output=True, text=True)
+        return result.stdout, result.stderr
+
+    def retrieve_tar(self, pairs):
+        self.retrieved.append(list(pairs))
+
+
+def test_run_many_groups_by_server_and_splits_marked_output(tmp_path, monkeypatch):
+    from xespresso.schedulers import remote_mixin
+    from xespresso.schedulers.slurm import SlurmScheduler
+
+    # sbatch stand-in: the job ID is the name of the submission directory
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    sbatch = bin_dir / "sbatch"
+    sbatch.write_text(
+        '#!/bin/bash\n'
+        'echo "Submitted batch job $(basename "$PWD")"\n'
+        'echo "note from $(basename "$PWD")" >&2\n'
+    )
+    sbatch.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}:{os.environ['PATH']}")
+    monkeypatch.setattr(remote_mixin, "SLURM_ENV_SETUP", "true")
+
+    remotes = {}
+
+    def fake_get(username, host, auth_config):
+        remote = remotes.setdefault(host, FakeBatchRemote(host))
+        remote.refs += 1
+        return remote
+
+    monkeypatch.setattr(remote_mixin.RemoteAuth, "get", staticmethod(fake_get))
+    monkeypatch.setattr(remote_mixin.RemoteExecutionMixin, "_stage_remote", lambda self, upload_job=False: None)
+    waits = []
+    monkeypatch.setattr(
+        remote_mixin.RemoteExecutionMixin,
+        "_wait_for_slurm_completion",
+        lambda self, job_ids: waits.append((self.remote.host, job_ids)),
+    )
+
+    schedulers = []
+    for host, job_id in (("a", "101"), ("b", "201"), ("a", "102")):
+        (tmp_path / host / job_id).mkdir(parents=True)
+        queue = {
+            "execution": "remote",
+            "scheduler": "slurm",
+            "remote_host": host,
+            "remote_user": "user",
+            "remote_auth": {},
+            "remote_dir": str(tmp_path / host),
+        }
+        schedulers.append(SlurmScheduler(FakeCalc(job_id), queue, "pw.x"))
+
+    results = remote_mixin.RemoteExecutionMixin.run_many(schedulers)
+
+    assert results == [
+        ("Submitted batch job 101\n", "note from 101\n"),
+        ("Submitted batch job 201\n", "note from 201\n"),
+        ("Submitted batch job 102\n", "note from 102\n"),
+    ]
+    # One submission exec and one output retrieval per server
+    assert len(remotes["a"].commands) == len(remotes["b"].commands) == 1
+    assert sorted(waits) == [("a", "101,102"), ("b", "201")]
+    assert [len(pairs) for pairs in remotes["a"].retrieved] == [2]
+    assert [len(pairs) for pairs in remotes["b"].retrieved] == [1]
+    assert remotes["a"].refs == remotes["b"].refs == 0
+
+
+def test_sftp_channels_per_session_are_capped(monkeypatch):
+    from types import SimpleNamespace
+    from xespresso.utils import auth
+
+    remote = auth.RemoteAuth("user", "cluster", {})
+    remote.client = SimpleNamespace(get_transport=lambda: None)
+    monkeypatch.setattr(remote, "connect", lambda: None)
+    monkeypatch.setattr(
+        auth, "_paramiko",
+        lambda: SimpleNamespace(SFTPClient=SimpleNamespace(from_transport=lambda *a, **k: object())),
+    )
+    in_use, peak = [], []
+    lock = threading.Lock()
+
+    def transfer():
+        with remote._channel() as sftp:
+            with lock:
+                in_use.append(sftp)
+                peak.append(len(in_use))
+            time.sleep(0.02)
+            with lock:
+                in_use.remove(sftp)
+
+    threads = [threading.Thread(target=transfer) for _ in range(3 * auth.SFTP_MAX_CHANNELS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert max(peak) <= auth.SFTP_MAX_CHANNELS
+    assert len(remote._sftp_channels) <= auth.SFTP_MAX_CHANNELS
+
+
+def test_ssh_multiplexing_is_opt_in(monkeypatch):
+    from xespresso.utils import auth
+
+    calls = _record_runs(monkeypatch)
+    auth.RemoteAuth("user", "cluster", {}).send_file_scp("a.txt", "/remote/a.txt")
+    auth.RemoteAuth("user", "cluster", {"multiplex": True}).send_file_scp("a.txt", "/remote/a.txt")
+    assert not any(arg.startswith("Control") for arg in calls[0][0])
+    assert "ControlMaster=auto" in calls[1][0]
+
+
+class FakeChannel:
+    """Exec channel with empty output, whose stdout read raises `error` if given."""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.closed = False
+
+    def exec_command(self, command):
+        pass
+
+    def shutdown_write(self):
+        pass
+
+    def recv(self, size):
+        if self.error:
+            raise self.error
+        return b""
+
+    def recv_stderr(self, size):
+        return b""
+
+    def recv_exit_status(self):
+        return 0
+
+    def close(self):
+        self.closed = True
+
+
+def test_run_command_closes_the_channel_on_errors(monkeypatch):
+    import pytest
+    from types import SimpleNamespace
+    from xespresso.utils import auth
+
+    remote = auth.RemoteAuth("user", "cluster", {})
+    channel = FakeChannel(OSError("connection reset"))
+    remote.client = SimpleNamespace(get_transport=lambda: SimpleNamespace(open_session=lambda: channel))
+    monkeypatch.setattr(remote, "connect", lambda: None)
+    with pytest.raises(RuntimeError, match="connection reset"):
+        remote.run_command("true")
+    assert channel.closed
+
+
+def test_long_running_commands_do_not_take_exec_slots(monkeypatch):
+    import pytest
+    from types import SimpleNamespace
+    from xespresso.utils import auth
+
+    remote = auth.RemoteAuth("user", "cluster", {})
+    remote.client = SimpleNamespace(get_transport=lambda: SimpleNamespace(open_session=FakeChannel))
+    monkeypatch.setattr(remote, "connect", lambda: None)
+
+    for _ in range(auth.EXEC_MAX_CHANNELS):
+        remote._exec_slots.acquire()
+    assert remote.run_command("squeue", long_running=True) == ("", "")
+
+    for _ in range(auth.WAIT_MAX_CHANNELS):
+        remote._wait_slots.acquire()
+    with pytest.raises(RuntimeError, match="No free channel"):
+        remote.run_command("squeue", long_running=True)
+
+
+def test_tunnelled_localhost_is_not_treated_as_local(monkeypatch):
+    from xespresso.utils import auth
+
+    monkeypatch.setattr(auth, "_LOCAL_USER", "me")
+    assert auth.RemoteAuth("me", "localhost", {})._is_local
+    assert not auth.RemoteAuth("me", "localhost", {"port": 2222})._is_local
+    assert not auth.RemoteAuth("someone", "localhost", {})._is_local
+
+
+def test_controller_ping_falls_back_to_scontrol_when_pyslurm_fails(monkeypatch):
+    from types import SimpleNamespace
+    from xespresso.utils import slurm
+
+    def broken_config():
+        raise OSError("libslurm.so: version mismatch")
+
+    monkeypatch.setattr(slurm, "_pyslurm", lambda: SimpleNamespace(config=broken_config))
+    calls = _record_runs(monkeypatch)
+    assert slurm._ping_controller()
+    assert calls[0][0] == ["scontrol", "ping"]
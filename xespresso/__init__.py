@@ -1 +1,6 @@
+from xespresso.utils import warnings as _warnings
 from xespresso.xespresso import Espresso
+
+# Install the package's warning format once, on first import, instead of
+# from every submodule that emits warnings.
+_warnings.apply_custom_format()
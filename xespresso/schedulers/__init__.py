@@ -1,4 +1,4 @@
-from .factory import get_scheduler
+from .factory import get_scheduler, write_scripts
 from .base import Scheduler
 
-__all__ = ["get_scheduler", "Scheduler"]
+__all__ = ["get_scheduler", "write_scripts", "Scheduler"]
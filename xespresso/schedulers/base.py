@@ -1,5 +1,27 @@
 import os
+import re
+import shlex
 import subprocess
+from functools import lru_cache
+
+# Resolved once; used to locate the optional queue["xespressorc"] file
+_HOME = os.path.expanduser("~")
+
+# Operators, expansions, comments, history/negation, quoting or a leading
+# VAR=value assignment: such submission commands are run through /bin/sh
+# rather than exec'd directly, so shlex never has to mimic the shell
+_SHELL_SYNTAX = re.compile(r"[;&|<>()$`*?\[\]{}~!#'\"\\\n]|^\s*[A-Za-z_]\w*=")
+
+@lru_cache(maxsize=32)
+def _read_shell_fragment(path, mtime_ns):
+    """
+    Returns the content of a shell config file.
+
+    Memoized on (path, mtime_ns) so that ensembles sharing the same file
+    read it once, while edits to the file still invalidate the cache.
+    """
+    with open(path, "r") as f:
+        return f.read()
 
 class Scheduler:
     """
@@ -71,10 +93,11 @@ class Scheduler:
 
         config_name = self.queue.get("xespressorc")
         if config_name:
-            home_path = os.path.join(os.environ.get("HOME", ""), config_name)
-            if os.path.exists(home_path):
-                with open(home_path, "r") as f:
-                    lines.append(f.read())
+            home_path = os.path.join(_HOME, config_name)
+            try:
+                lines.append(_read_shell_fragment(home_path, os.stat(home_path).st_mtime_ns))
+            except FileNotFoundError:
+                pass
 
         return "\n".join(lines)
 
@@ -87,6 +110,17 @@ class Scheduler:
         """
         return self.queue.get("postpend", "")
 
+    def _write_job_file(self, lines):
+        """
+        Writes the job script to disk in a single write call.
+
+        Args:
+            lines (list[str]): Script lines, joined with newlines.
+        """
+        data = "\n".join(lines).encode()
+        with open(os.path.join(self.script_dir, self.job_file), "wb") as f:
+            f.write(data)
+
     def write_script(self):
         """
         Abstract method to write the job script.
@@ -107,8 +141,13 @@ class Scheduler:
 
     def run(self):
         """
-        Executes the job locally using os.system.
+        Executes the job locally.
 
+        Plain submission commands (e.g. 'bash job_file', 'sbatch job_file')
+        are exec'd directly, with no intermediate /bin/sh, so a local run
+        costs a single fork+exec of the job interpreter. Commands using shell
+        syntax (operators, redirects, expansions, comments, quotes, VAR=value
+        prefixes) still run through the shell, as before.
         This method can be overridden by subclasses to support remote execution
         via SSH or other mechanisms.
 
@@ -116,5 +155,16 @@ class Scheduler:
             tuple: (stdout, stderr) if applicable, else (None, None)
         """
 #        os.system(self.submit_command())
-        subprocess.run(self.submit_command(), shell=True, cwd=self.script_dir, check=True)
+        command = self.submit_command()
+        if _SHELL_SYNTAX.search(command):
+            subprocess.run(command, shell=True, cwd=self.script_dir, check=True)
+        else:
+            args = shlex.split(command)
+            try:
+                subprocess.run(args, cwd=self.script_dir, check=True)
+            except FileNotFoundError as e:
+                if e.filename != args[0]:
+                    raise
+                # Same error as through the shell, which exits 127 for a missing command
+                raise subprocess.CalledProcessError(127, command) from None
         return None, None
@@ -1,4 +1,3 @@
-import os
 from .base import Scheduler
 from .remote_mixin import RemoteExecutionMixin
 
@@ -22,6 +21,10 @@ class DirectScheduler(RemoteExecutionMixin, Scheduler):
         run(): Executes the job locally or remotely (via mixin).
     """
 
+    def __init__(self, calc, queue, command):
+        super().__init__(calc, queue, command)
+        self._submit_cmd = f"bash {self.job_file}"
+
     def write_script(self):
         lines = ["#!/bin/bash", ""]
 
@@ -38,9 +41,7 @@ class DirectScheduler(RemoteExecutionMixin, Scheduler):
         if self.post_script:
             lines.append(self.post_script)
 
-        # Write to job file
-        with open(os.path.join(self.script_dir, self.job_file), "w") as f:
-            f.write("\n".join(lines))
+        self._write_job_file(lines)
 
     def submit_command(self):
-        return f"bash {self.job_file}"
+        return self._submit_cmd
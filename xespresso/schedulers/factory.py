@@ -1,5 +1,30 @@
-from .slurm import SlurmScheduler
-from .direct import DirectScheduler
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+
+# Scheduler classes are resolved on first use so that importing the factory
+# does not pull in every backend (and their transitive SSH dependencies).
+_scheduler_paths = {
+    "slurm": ("xespresso.schedulers.slurm", "SlurmScheduler"),
+    "direct": ("xespresso.schedulers.direct", "DirectScheduler"),
+}
+_scheduler_classes = {}
+
+def _resolve_scheduler(scheduler_type):
+    """
+    Imports and caches the Scheduler subclass registered for `scheduler_type`.
+
+    Raises:
+        ValueError: If the scheduler type is not registered.
+    """
+    scheduler_class = _scheduler_classes.get(scheduler_type)
+    if scheduler_class is None:
+        try:
+            module_name, class_name = _scheduler_paths[scheduler_type]
+        except KeyError:
+            raise ValueError(f"Unsupported scheduler: {scheduler_type}") from None
+        scheduler_class = getattr(importlib.import_module(module_name), class_name)
+        _scheduler_classes[scheduler_type] = scheduler_class
+    return scheduler_class
 
 def get_scheduler(calc, queue, command):
     """
@@ -8,6 +33,7 @@ def get_scheduler(calc, queue, command):
     This function inspects the 'scheduler' key in the queue dictionary and
     instantiates the corresponding scheduler class. It abstracts away the
     selection logic, allowing the main interface to remain clean and modular.
+    Scheduler modules are imported lazily the first time they are requested.
 
     Supported schedulers:
         - "slurm": Uses SlurmScheduler (submits via sbatch)
@@ -25,10 +51,29 @@ def get_scheduler(calc, queue, command):
         ValueError: If the scheduler type is unsupported or missing.
     """
     scheduler_type = queue.get("scheduler", "slurm").lower()
+    return _resolve_scheduler(scheduler_type)(calc, queue, command)
+
+def _write_one(job):
+    scheduler = get_scheduler(*job)
+    scheduler.write_script()
+    return scheduler
 
-    if scheduler_type == "slurm":
-        return SlurmScheduler(calc, queue, command)
-    elif scheduler_type == "direct":
-        return DirectScheduler(calc, queue, command)
-    else:
-        raise ValueError(f"Unsupported scheduler: {scheduler_type}")
+def write_scripts(jobs, max_workers=None):
+    """
+    Builds schedulers and writes their job scripts for many calculations at once.
+
+    Each job is independent (its own calculator directory and job file), so
+    the work is spread across a thread pool. Threads are used instead of
+    processes because script generation is dominated by file I/O and
+    calculators are expensive to pickle.
+
+    Args:
+        jobs (iterable): (calc, queue, command) tuples, as for get_scheduler().
+        max_workers (int, optional): Size of the thread pool. Defaults to the
+            ThreadPoolExecutor default.
+
+    Returns:
+        list[Scheduler]: Scheduler instances in the same order as `jobs`.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_write_one, jobs))
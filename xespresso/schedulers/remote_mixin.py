@@ -1,12 +1,117 @@
 import os
+import json
+import time
+import shlex
+import posixpath
 import hashlib
-from xespresso.utils.auth import RemoteAuth
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from xespresso.utils.auth import RemoteAuth, SFTP_MAX_CHANNELS
+from xespresso.utils.slurm import parse_job_id
 from xespresso.utils import warnings as warnings  # Custom warning system
 
-# Apply custom formatting globally (if your module supports it)
-warnings.formatwarning = lambda msg, cat, fname, lineno, *_: (
-    f"\n⚠️ {cat.__name__} in {fname}:{lineno}\n→ {msg}\n"
-)
+# Local hash constructors keyed by the remote utility producing the same digest.
+# BLAKE3 is used only when the optional `blake3` package is installed locally
+# and `b3sum` exists on the remote host; SHA256 is the fallback.
+_HASHERS = {"sha256sum": hashlib.sha256}
+try:
+    import blake3
+    _HASHERS["b3sum"] = blake3.blake3
+except ImportError:
+    pass
+
+# Login environment sourced before any SLURM command (sbatch, squeue, sacct)
+SLURM_ENV_SETUP = "source /etc/profile"
+# Remote-side squeue poll interval (seconds) while blocking on a SLURM job
+SLURM_POLL_INTERVAL = 5
+# Bounds of the local backoff used when the blocking remote wait is unavailable
+SLURM_BACKOFF_START = 2
+SLURM_BACKOFF_MAX = 60
+
+# Record of pseudopotentials already uploaded and verified on remote hosts
+PSEUDO_CACHE_PATH = os.path.expanduser("~/.xespresso/pseudo_cache.json")
+# Last-resort local pseudopotential directory, resolved once
+_HOME_PSEUDO_DIR = os.path.expanduser("~/espresso/pseudo/")
+
+def _load_pseudo_cache():
+    try:
+        with open(PSEUDO_CACHE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+# Serializes read-modify-write of the cache when calculations run concurrently
+_PSEUDO_CACHE_LOCK = threading.Lock()
+
+def _save_pseudo_cache(cache):
+    """Writes the pseudopotential cache atomically (temp file + os.replace)."""
+    tmp_path = f"{PSEUDO_CACHE_PATH}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(PSEUDO_CACHE_PATH), exist_ok=True)
+        with open(tmp_path, "w") as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp_path, PSEUDO_CACHE_PATH)
+    except OSError as e:
+        warnings.warn(f"Could not update pseudopotential cache: {e}")
+
+@lru_cache(maxsize=8)
+def _pseudo_index(dir_stamps):
+    """
+    Maps pseudopotential file names to their path in the first directory
+    that contains them as a regular file (symlinks to one included).
+
+    Memoized on ((dir, mtime_ns), ...) so that each directory is listed
+    once, while adding or removing files still invalidates the index.
+    """
+    index = {}
+    for pseudo_dir, _ in dir_stamps:
+        try:
+            entries = list(os.scandir(pseudo_dir))
+        except OSError:
+            continue
+        for entry in entries:
+            # Subdirectories and dangling symlinks are skipped, so a later
+            # directory holding the actual file still wins
+            if entry.name not in index and entry.is_file():
+                index[entry.name] = entry.path
+    return index
+
+def _stamp_dirs(search_dirs):
+    stamps = []
+    for pseudo_dir in search_dirs:
+        try:
+            stamps.append((pseudo_dir, os.stat(pseudo_dir).st_mtime_ns))
+        except OSError:
+            pass
+    return tuple(stamps)
+
+def _locate_pseudo(pseudo_file, search_dirs):
+    """
+    Returns the local path of `pseudo_file`, or None if it cannot be found.
+
+    Plain file names are looked up in the cached directory index. Names
+    with a subdirectory (e.g. "PBE/Fe.UPF") are not in the index, so on a
+    miss each search directory is checked directly, in priority order.
+    """
+    local_path = _pseudo_index(_stamp_dirs(search_dirs)).get(pseudo_file)
+    if local_path:
+        return local_path
+    for pseudo_dir in search_dirs:
+        candidate = os.path.join(pseudo_dir, pseudo_file)
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+class _NullLogger:
+    """Stand-in used when no logger is attached to the scheduler."""
+
+    def info(self, msg, *args, **kwargs):
+        pass
+
+    warning = error = debug = info
+
+_NULL_LOGGER = _NullLogger()
 
 class RemoteExecutionMixin:
     """
@@ -14,12 +119,16 @@ class RemoteExecutionMixin:
 
     Features:
     - Reuses SSH connection across multiple calculations on the same server
+    - Shares connections process-wide through RemoteAuth.get()
+    - Reconnects transparently if a pooled connection was dropped
+    - Closes all pooled connections at interpreter exit
     - Automatically opens a new connection if the server or user changes
     - Dynamically computes remote working directory based on calc.directory
     - Avoids redundant remote_path setup if calc.directory hasn't changed
     - Transfers required pseudopotentials to remote ./pseudo directory
     - Logs file transfers and warnings
     - Validates file integrity using SHA256 checksums
+    - Skips pseudopotentials already uploaded and verified (size + mtime cache)
 
     Assumes:
     - self.calc: an Espresso calculator with .prefix, .package, and .directory
@@ -33,77 +142,241 @@ class RemoteExecutionMixin:
     - self.submit_command(): method that returns the job submission command
     - self.logger: optional logger object with .info() and .warning()
     """
-    _remote_sessions = {}
     _last_remote_path = None
 
+    @property
+    def _log(self):
+        """The attached logger, or a no-op logger if none was set."""
+        logger = getattr(self, "logger", None)
+        return logger if logger is not None else _NULL_LOGGER
+
     def _setup_remote(self):
-        key = (self.queue["remote_host"], self.queue["remote_user"])
-        if key not in self._remote_sessions:
-            remote = RemoteAuth(
-                username=self.queue["remote_user"],
-                host=self.queue["remote_host"],
-                auth_config=self.queue["remote_auth"]
-            )
-            remote.connect()
-            self._remote_sessions[key] = remote
-        self.remote = self._remote_sessions[key]
+        remote = RemoteAuth.get(
+            username=self.queue["remote_user"],
+            host=self.queue["remote_host"],
+            auth_config=self.queue["remote_auth"]
+        )
+        if not remote.is_active():
+            # New session, or the pooled connection was dropped by the server
+            try:
+                remote.reconnect()
+            except Exception:
+                remote.release()
+                raise
+        self.remote = remote
 
-        current_path = os.path.join(self.queue["remote_dir"], self.calc.directory)
+        # Remote paths are always POSIX, whatever the local OS
+        current_path = posixpath.join(self.queue["remote_dir"], self.calc.directory)
         if current_path != self._last_remote_path:
             self.remote_path = current_path
             self._last_remote_path = current_path
 
-    def _sha256(self, filepath):
-        """Returns SHA256 checksum of a file."""
-        h = hashlib.sha256()
-        with open(filepath, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                h.update(chunk)
-        return h.hexdigest()
+    def _checksum_tool(self):
+        """Returns the fastest checksum utility usable on both ends."""
+        if "b3sum" in _HASHERS and self.remote.has_command("b3sum"):
+            return "b3sum"
+        return "sha256sum"
+
+    def _send_and_hash(self, local_path, remote_path, tool="sha256sum"):
+        """
+        Uploads a file and returns its checksum (matching the remote `tool`).
+
+        The post-upload size check is skipped since the checksum comparison
+        supersedes it.
+        """
+        return self.remote.send_file_hashed(local_path, remote_path, _HASHERS[tool], confirm=False)
+
+    def _verify_checksums(self, transferred, tool="sha256sum"):
+        """
+        Compares local and remote checksums of transferred files.
+
+        Local digests are taken during upload (see `_send_and_hash`); all
+        remote digests are computed by a single `tool` invocation
+        (one SSH round-trip).
+
+        Args:
+            transferred (list[tuple]): (symbol, pseudo_file, local_path,
+                remote_path, local_stat, local_hash).
+            tool (str): Remote checksum utility ("sha256sum" or "b3sum").
+
+        Returns:
+            list[tuple]: The entries of `transferred` whose checksums matched.
+        """
+        verified = []
+        if not transferred:
+            return verified
+        remote_hashes = self.remote.checksum_many([entry[3] for entry in transferred], tool)
+        for entry in transferred:
+            symbol, pseudo_file, _, remote_path, _, local_hash = entry
+            if local_hash != remote_hashes[remote_path]:
+                warnings.warn(f"Checksum mismatch for {pseudo_file} after transfer.")
+                self._log.warning(f"Checksum mismatch: {pseudo_file}")
+            else:
+                verified.append(entry)
+                self._log.info(f"Transferred {pseudo_file} for {symbol} with verified checksum.")
+        return verified
+
+    def _pseudo_search_dirs(self):
+        """
+        Returns the local directories searched for pseudopotentials, in priority order.
+
+        The list is cached on the instance and rebuilt only when
+        CONTROL["pseudo_dir"] changes.
+        """
+        control = self.calc.parameters.get("input_data", {}).get("CONTROL", {})
+        pseudo_dir = control.get("pseudo_dir")
+        cached = getattr(self, "_search_dirs", None)
+        if cached is None or cached[0] != pseudo_dir:
+            search_dirs = []
+            if pseudo_dir is not None:
+                search_dirs.append(pseudo_dir)
+            if "ESPRESSO_PSEUDO" in os.environ:
+                search_dirs.append(os.environ["ESPRESSO_PSEUDO"])
+            search_dirs.append(_HOME_PSEUDO_DIR)
+            cached = self._search_dirs = (pseudo_dir, search_dirs)
+        return cached[1]
 
     def _transfer_pseudopotentials(self, max_retries=1):
         pseudopotentials = self.calc.parameters.get("pseudopotentials", {})
-        remote_pseudo_dir = os.path.join(self.remote_path, "pseudo")
-        self.remote.run_command(f"mkdir -p {remote_pseudo_dir}")
+        remote_pseudo_dir = posixpath.join(self.remote_path, "pseudo")
+        # Pseudopotentials given with a subdirectory need it on the remote too
+        self.remote.makedirs(remote_pseudo_dir, *{
+            posixpath.dirname(posixpath.join(remote_pseudo_dir, pseudo_file))
+            for pseudo_file in pseudopotentials.values()
+        })
 
-        search_dirs = []
-        control = self.calc.parameters.get("input_data", {}).get("CONTROL", {})
-        if "pseudo_dir" in control:
-            search_dirs.append(control["pseudo_dir"])
-        if "ESPRESSO_PSEUDO" in os.environ:
-            search_dirs.append(os.path.join(os.environ["ESPRESSO_PSEUDO"]))
-        search_dirs.append(os.path.expanduser("~/espresso/pseudo/"))
+        search_dirs = self._pseudo_search_dirs()
 
+        cache = _load_pseudo_cache()
+        cache_prefix = f"{self.remote.username}@{self.remote.host}:{self.remote.port}:"
+        pending = []  # Pseudopotentials that need uploading
         for symbol, pseudo_file in pseudopotentials.items():
-            found = False
-            for attempt in range(max_retries + 1):
-                for pseudo_dir in search_dirs:
-                    local_path = os.path.join(pseudo_dir, pseudo_file)
-                    if os.path.exists(local_path):
-                        remote_path = os.path.join(remote_pseudo_dir, pseudo_file)
-                        self.remote.send_file(local_path, remote_path)
-
-                        # Verify checksum
-                        local_hash = self._sha256(local_path)
-                        remote_hash = self.remote.sha256(remote_path)
-                        if local_hash != remote_hash:
-                            warnings.warn(f"Checksum mismatch for {pseudo_file} after transfer.")
-                            if hasattr(self, "logger"):
-                                self.logger.warning(f"Checksum mismatch: {pseudo_file}")
-                        else:
-                            if hasattr(self, "logger"):
-                                self.logger.info(f"Transferred {pseudo_file} for {symbol} with verified checksum.")
-                        found = True
-                        break
-                if found:
+            local_path = _locate_pseudo(pseudo_file, search_dirs)
+            for attempt in range(max_retries):
+                if local_path:
                     break
-            if not found:
+                # Rescan in case a search directory changed meanwhile
+                local_path = _locate_pseudo(pseudo_file, search_dirs)
+            if not local_path:
                 warnings.warn(f"Pseudopotential '{pseudo_file}' not found in any known directory.")
-                if hasattr(self, "logger"):
-                    self.logger.warning(f"Missing pseudopotential: {pseudo_file} for {symbol}")
+                self._log.warning(f"Missing pseudopotential: {pseudo_file} for {symbol}")
+                continue
+
+            remote_path = posixpath.join(remote_pseudo_dir, pseudo_file)
+            # Skip files already uploaded and verified, unchanged on both sides
+            local_stat = os.stat(local_path)
+            entry = cache.get(cache_prefix + remote_path)
+            if (
+                entry
+                and entry["size"] == local_stat.st_size
+                and entry["mtime_ns"] == local_stat.st_mtime_ns
+            ):
+                remote_stat = self.remote.stat(remote_path)
+                if remote_stat is not None and remote_stat.st_size == local_stat.st_size:
+                    self._log.info(f"{pseudo_file} for {symbol} already on remote, skipping transfer.")
+                    continue
+            pending.append((symbol, pseudo_file, local_path, remote_path, local_stat))
+
+        transferred = []
+        tool = None  # Checksum utility, probed only if something is uploaded
+        if pending:
+            tool = self._checksum_tool()
+            # Uploads run side by side, each on its own SFTP channel
+            with ThreadPoolExecutor(max_workers=min(SFTP_MAX_CHANNELS, len(pending))) as executor:
+                hashes = executor.map(
+                    lambda item: self._send_and_hash(item[2], item[3], tool),
+                    pending,
+                )
+                transferred = [item + (local_hash,) for item, local_hash in zip(pending, hashes)]
 
-        self.calc.parameters["input_data"]["CONTROL"]["pseudo_dir"] = "./pseudo"
-        self.calc.write_input(self.calc.atoms)
+        verified = self._verify_checksums(transferred, tool)
+        if verified:
+            with _PSEUDO_CACHE_LOCK:
+                cache = _load_pseudo_cache()
+                for _, _, _, remote_path, local_stat, digest in verified:
+                    cache[cache_prefix + remote_path] = {
+                        "size": local_stat.st_size,
+                        "mtime_ns": local_stat.st_mtime_ns,
+                        "checksum": f"{tool}:{digest}",
+                    }
+                _save_pseudo_cache(cache)
+
+        # Point the input at the uploaded copies; re-render it only if needed
+        control = self.calc.parameters["input_data"]["CONTROL"]
+        if control.get("pseudo_dir") != "./pseudo":
+            control["pseudo_dir"] = "./pseudo"
+            self.calc.write_input(self.calc.atoms)
+
+    def _wait_for_slurm_completion(self, job_id):
+        """
+        Blocks until a SLURM job (or several) has left the queue.
+
+        The wait runs as a single remote shell loop, so polling costs no SSH
+        round-trips and the job end is noticed within SLURM_POLL_INTERVAL.
+        It uses one of the session's few long-running channels, never an
+        exec slot needed by transfers. If none is free, or the long-lived
+        exec fails (e.g. the connection is dropped), the queue is polled
+        from here with exponential backoff instead, reconnecting the same
+        pooled session whenever its transport is gone.
+
+        Args:
+            job_id (str): SLURM job ID, or several comma-separated IDs.
+
+        Returns:
+            str: Final job state reported by sacct, or "UNKNOWN".
+        """
+        squeue = f"squeue -h -j {job_id} -o %T 2>/dev/null"
+        sacct = f"sacct -j {job_id} -X -n -o State --parsable2 2>/dev/null | head -n 1"
+        try:
+            stdout, _ = self.remote.run_command(
+                f"{SLURM_ENV_SETUP}; "
+                f"while {squeue} | grep -q .; do sleep {SLURM_POLL_INTERVAL}; done; {sacct}",
+                long_running=True,
+            )
+        except (RuntimeError, OSError) as e:
+            self._log.warning(f"Remote wait for job {job_id} unavailable ({e}), falling back to polling.")
+            delay = SLURM_BACKOFF_START
+            while True:
+                if not self.remote.is_active():
+                    self.remote.reconnect()
+                status, _ = self.remote.run_command(f"{SLURM_ENV_SETUP}; {squeue}")
+                if not status.strip():
+                    break
+                time.sleep(delay)
+                delay = min(SLURM_BACKOFF_MAX, SLURM_BACKOFF_START + 1.5 * delay)
+            stdout, _ = self.remote.run_command(f"{SLURM_ENV_SETUP}; {sacct}")
+        return stdout.strip() or "UNKNOWN"
+
+    def _stage_remote(self, upload_job=False):
+        """
+        Uploads everything a remote job needs: pseudopotentials, the input
+        file and, if `upload_job`, the job script. Requires _setup_remote().
+        """
+        self._transfer_pseudopotentials()
+
+        input_file = os.path.join(self.calc.directory, f"{self.calc.prefix}.{self.calc.package}i")
+        if upload_job:
+            # Input and job script travel together as one small tar stream
+            job_file = os.path.join(self.calc.directory, self.job_file)
+            self.remote.send_tar([input_file, job_file], self.remote_path)
+        else:
+            self.remote.send_file(input_file, f"{self.remote_path}/{os.path.basename(input_file)}")
+
+    def _submit_steps(self, *extra):
+        """Returns the shell steps that cd into the remote directory and submit the job."""
+        steps = [f"cd {shlex.quote(self.remote_path)}", *extra]
+        if self.queue.get("scheduler") == "slurm":
+            steps.append(SLURM_ENV_SETUP)
+        steps.append(self.submit_command())
+        return steps
+
+    def _output_pair(self):
+        """Returns the (remote_path, local_path) of the calculation's output file."""
+        output_file = f"{self.calc.prefix}.{self.calc.package}o"
+        return f"{self.remote_path}/{output_file}", os.path.join(self.calc.directory, output_file)
+
+    def _retrieve_output(self):
+        self.remote.retrieve_file(*self._output_pair())
 
     def run(self):
         """
@@ -112,9 +385,9 @@ class RemoteExecutionMixin:
         Behavior:
             - For remote execution:
                 - Sets up SSH connection and remote working directory
-                - Transfers input and job script files
-                - Submits job using the scheduler's submit_command()
-                - If scheduler is SLURM, waits for job completion via squeue polling
+                - Transfers the input file via SFTP
+                - Streams the job script and submits it in a single SSH exec
+                - If scheduler is SLURM, waits for job completion (remote-side squeue loop)
                 - Retrieves output file only after job finishes
             - For direct/local execution:
                 - Falls back to the base Scheduler.run() method
@@ -126,51 +399,139 @@ class RemoteExecutionMixin:
             return super().run()
 
         self._setup_remote()
+        try:
+            self._stage_remote()
 
-        input_file = f"{self.calc.prefix}.{self.calc.package}i"
-        output_file = f"{self.calc.prefix}.{self.calc.package}o"
-        job_file = self.job_file
+            self._log.info(f"Submitting job via: {self.submit_command()}")
 
-        local_input = os.path.join(self.calc.directory, input_file)
-        local_output = os.path.join(self.calc.directory, output_file)
-        local_job = os.path.join(self.calc.directory, job_file)
+            # The job script travels on the submission channel's stdin, so upload,
+            # cd and submit share a single SSH exec instead of an SFTP put + exec.
+            with open(os.path.join(self.calc.directory, self.job_file), "rb") as f:
+                job_script = f.read()
+            steps = self._submit_steps(f"cat > {shlex.quote(self.job_file)}")
+            stdout, stderr = self.remote.run_command(" && ".join(steps), input_data=job_script)
 
-        self._transfer_pseudopotentials()
+            # If SLURM, extract job ID and wait for completion
+            if self.queue.get("scheduler") == "slurm":
+                job_id = parse_job_id(stdout)
 
-        self.remote.send_file(local_input, f"{self.remote_path}/{input_file}")
-        self.remote.send_file(local_job, f"{self.remote_path}/{job_file}")
+                if job_id:
+                    self._log.info(f"Waiting for SLURM job {job_id} to complete...")
+                    state = self._wait_for_slurm_completion(job_id)
+                    self._log.info(f"SLURM job {job_id} finished with state {state}")
 
-        if hasattr(self, "logger"):
-            self.logger.info(f"Submitting job via: {self.submit_command()}")
+            self._retrieve_output()
+        finally:
+            self.remote.release()
 
-        env_setup = "source /etc/profile" if self.queue.get("scheduler") == "slurm" else ""
-        command = f"cd {self.remote_path} && {env_setup} && {self.submit_command()}"
-        stdout, stderr = self.remote.run_command(command)
+        return stdout, stderr
 
-        # If SLURM, extract job ID and wait for completion
-        if self.queue.get("scheduler") == "slurm":
-            import re, time
+    @classmethod
+    def run_many(cls, schedulers, max_workers=SFTP_MAX_CHANNELS):
+        """
+        Runs several calculations, overlapping their transfers and batching submission.
 
-            match = re.search(r"Submitted batch job (\\d+)", stdout)
-            job_id = match.group(1) if match else None
+        Compared with calling run() on each scheduler in turn:
+            - uploads of all jobs run concurrently: pseudopotentials on
+              separate SFTP channels, each job's input and script as one
+              tar stream
+            - all jobs bound for the same server are submitted by one SSH exec
+            - SLURM jobs on a server are awaited together by one remote loop,
+              and different servers are awaited concurrently, only after
+              every job has been submitted
+            - each server's outputs are retrieved as one tar stream, servers
+              concurrently
+        Schedulers configured for local execution simply run() in order.
 
-            if job_id:
-                if hasattr(self, "logger"):
-                    self.logger.info(f"Waiting for SLURM job {job_id} to complete...")
+        Args:
+            schedulers (iterable): Scheduler instances with their scripts written.
+            max_workers (int): Maximum number of jobs staged or retrieved at once.
 
-                while True:
-                    status = self.remote.run_command(f"squeue -j {job_id}")
-                    if job_id not in status:
-                        break
-                    time.sleep(10)
+        Returns:
+            list[tuple]: (stdout, stderr) of each submission, in input order.
+        """
+        schedulers = list(schedulers)
+        results = [None] * len(schedulers)
+        remote_jobs = []
+        try:
+            for i, scheduler in enumerate(schedulers):
+                if scheduler.queue.get("execution") != "remote":
+                    results[i] = scheduler.run()
+                else:
+                    scheduler._setup_remote()
+                    remote_jobs.append((i, scheduler))
+            if remote_jobs:
+                cls._run_remote_batch(remote_jobs, results, max_workers)
+        finally:
+            for _, scheduler in remote_jobs:
+                scheduler.remote.release()
 
-        self.remote.retrieve_file(f"{self.remote_path}/{output_file}", local_output)
+        return results
 
-        return stdout, stderr
+    @classmethod
+    def _run_remote_batch(cls, remote_jobs, results, max_workers):
+        """
+        Stages, submits, awaits and retrieves the remote jobs of run_many().
+
+        Args:
+            remote_jobs (list): (index, scheduler) pairs with sessions set up.
+            results (list): run_many() results, filled in at each index.
+            max_workers (int): Maximum number of jobs staged or retrieved at once.
+        """
+        workers = min(max_workers, len(remote_jobs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(lambda job: job[1]._stage_remote(upload_job=True), remote_jobs))
+
+        sessions = {}
+        waits = []
+        for job in remote_jobs:
+            sessions.setdefault(id(job[1].remote), []).append(job)
+        for jobs in sessions.values():
+            remote = jobs[0][1].remote
+            # Each job's output on both streams is preceded by a marker line
+            marker = f"@@xespresso-{os.getpid()}-{id(jobs)}@@"
+            parts = [
+                f"echo {marker}; echo {marker} >&2; ({' && '.join(scheduler._submit_steps())})"
+                for _, scheduler in jobs
+            ]
+            stdout, stderr = remote.run_command("; ".join(parts))
+            outs = stdout.split(f"{marker}\n")[1:]
+            errs = stderr.split(f"{marker}\n")[1:]
+            for n, (i, scheduler) in enumerate(jobs):
+                results[i] = (
+                    outs[n] if n < len(outs) else "",
+                    errs[n] if n < len(errs) else "",
+                )
+
+            job_ids = [
+                parse_job_id(results[i][0])
+                for i, scheduler in jobs
+                if scheduler.queue.get("scheduler") == "slurm"
+            ]
+            job_ids = [job_id for job_id in job_ids if job_id]
+            if job_ids:
+                waits.append((jobs[0][1], ",".join(job_ids)))
+
+        if waits:
+            def wait(job):
+                waiter, job_ids = job
+                waiter._log.info(f"Waiting for SLURM jobs {job_ids} to complete...")
+                waiter._wait_for_slurm_completion(job_ids)
+
+            with ThreadPoolExecutor(max_workers=len(waits)) as executor:
+                list(executor.map(wait, waits))
+
+        # Each server's outputs come back together as a single tar stream
+        with ThreadPoolExecutor(max_workers=min(workers, len(sessions))) as executor:
+            list(executor.map(
+                lambda jobs: jobs[0][1].remote.retrieve_tar(
+                    [scheduler._output_pair() for _, scheduler in jobs]
+                ),
+                sessions.values(),
+            ))
 
     @classmethod
     def close_all_connections(cls):
-        for remote in cls._remote_sessions.values():
-            remote.close()
-        cls._remote_sessions.clear()
+        """Closes all pooled SSH sessions (also done automatically at exit)."""
+        RemoteAuth.close_all()
         cls._last_remote_path = None
@@ -1,6 +1,60 @@
+from functools import lru_cache
 from .base import Scheduler
 from .remote_mixin import RemoteExecutionMixin
-import os
+
+# Shebang and per-job SBATCH directives, rendered in a single format_map call
+_SBATCH_HEADER = (
+    "#!/bin/bash\n"
+    "\n"
+    "#SBATCH --job-name={job_name}\n"
+    "#SBATCH --output={output}\n"
+    "#SBATCH --error={error}"
+)
+
+@lru_cache(maxsize=128)
+def _render_directives(items):
+    """Renders '#SBATCH --key=value' lines for a tuple of resource items."""
+    return tuple(f"#SBATCH --{name}={value}" for name, value in items)
+
+def _resource_directives(resources):
+    """
+    Returns the '#SBATCH --key=value' lines for queue["resources"].
+
+    Ensemble replicas usually share the same resources, so the rendered
+    block is cached per unique (ordered) set of items. Resources with
+    unhashable values are rendered without caching.
+    """
+    items = tuple(resources.items())
+    try:
+        return _render_directives(items)
+    except TypeError:
+        return _render_directives.__wrapped__(items)
+
+@lru_cache(maxsize=128)
+def _render_body(directives, config_script, command, post_script):
+    """
+    Renders everything after the per-job SBATCH header.
+
+    Ensemble jobs share resources, environment setup and usually the
+    command, so the body is rendered once per unique combination.
+    """
+    lines = list(directives)
+    lines.append("")  # Blank line after SBATCH block
+
+    # Environment setup
+    if config_script:
+        lines.append(config_script)
+        lines.append("")
+
+    # Main execution command
+    lines.append(command)
+    lines.append("")
+
+    # Post-execution block
+    if post_script:
+        lines.append(post_script)
+
+    return "\n".join(lines)
 
 class SlurmScheduler(RemoteExecutionMixin, Scheduler):
     """
@@ -27,6 +81,10 @@ class SlurmScheduler(RemoteExecutionMixin, Scheduler):
         post_script (str): Post-execution shell block.
     """
 
+    def __init__(self, calc, queue, command):
+        super().__init__(calc, queue, command)
+        self._submit_cmd = f"sbatch {self.job_file}"
+
     def write_script(self):
         """
         Generates a SLURM job script and writes it to disk.
@@ -37,40 +95,23 @@ class SlurmScheduler(RemoteExecutionMixin, Scheduler):
             - Execution command
             - Optional post-processing via post_script
         """
-        lines = ["#!/bin/bash", ""]
-
-        # SLURM directives
-        sbatch_keys = {
-            "job-name": self.queue.get("job_name", self.calc.prefix),
+        # Per-job SLURM directives
+        header = _SBATCH_HEADER.format_map({
+            "job_name": self.queue.get("job_name", self.calc.prefix),
             "output": self.queue.get("output", f"{self.calc.prefix}.out"),
-            "error": self.queue.get("error", f"{self.calc.prefix}.err")
-        }
-
-        for key, value in sbatch_keys.items():
-            lines.append(f"#SBATCH --{key}={value}")
-
-        # Additional SBATCH options
-        for key, value in self.queue.get("resources", {}).items():
-            lines.append(f"#SBATCH --{key}={value}")
-
-        lines.append("")  # Blank line after SBATCH block
-
-        # Environment setup
-        if self.config_script:
-            lines.append(self.config_script)
-            lines.append("")
-
-        # Main execution command
-        lines.append(self.command)
-        lines.append("")
+            "error": self.queue.get("error", f"{self.calc.prefix}.err"),
+        })
 
-        # Post-execution block
-        if self.post_script:
-            lines.append(self.post_script)
+        # Resources, environment, command and post-processing (cached)
+        body = _render_body(
+            _resource_directives(self.queue.get("resources", {})),
+            self.config_script,
+            self.command,
+            self.post_script,
+        )
+        lines = [header, body]
 
-        # Write to job file
-        with open(os.path.join(self.script_dir, self.job_file), "w") as f:
-            f.write("\n".join(lines))
+        self._write_job_file(lines)
 
     def submit_command(self):
         """
@@ -79,4 +120,4 @@ class SlurmScheduler(RemoteExecutionMixin, Scheduler):
         Returns:
             str: Command to submit the job script via sbatch.
         """
-        return f"sbatch {self.job_file}"
+        return self._submit_cmd
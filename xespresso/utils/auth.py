@@ -8,7 +8,7 @@ This module supports:
 - Persistent SSH and SFTP sessions via paramiko
 - Remote command execution
 - File transfer (send/retrieve)
-- Remote SHA256 checksum validation
+- Remote SHA256 (or BLAKE3, via b3sum) checksum validation
 - SSH key generation and installation via ssh-keygen and ssh-copy-id
 - Connectivity testing via subprocess
 
@@ -20,13 +20,125 @@ auth.send_file("local.txt", "~/remote.txt")
 """
 
 import os
+import shlex
+import atexit
+import shutil
+import socket
+import tarfile
+import weakref
+import getpass
+import hashlib
+import posixpath
+import threading
 import subprocess
-import paramiko
-from xespresso.utils import warnings as warnings
+from collections import OrderedDict
+from functools import lru_cache
+from contextlib import contextmanager
 from xespresso.utils.logging import get_logger
 
 logger = get_logger()
-warnings.apply_custom_format()
+
+# Seconds between SSH keepalive packets on persistent sessions
+KEEPALIVE_INTERVAL = 30
+# SFTP channel receive window (bytes). paramiko's default is 2 MiB, which caps
+# downloads at ~20 MB/s on a 100 ms link; a larger window keeps more
+# prefetched reads in flight per RTT.
+SFTP_WINDOW_SIZE = 16 * 1024 * 1024
+# Maximum number of pooled sessions kept by RemoteAuth.get()
+MAX_POOLED_SESSIONS = 16
+# Upper bounds on the channels a session keeps open at once on its single
+# SSH connection: SFTP channels for transfers, exec channels for commands
+# and tar streams, and wait channels for commands that may run for hours
+# (e.g. blocking on a SLURM job), which must not hold up the other two.
+# Together they stay within sshd's default MaxSessions (10), however many
+# threads share the session.
+SFTP_MAX_CHANNELS = 4
+EXEC_MAX_CHANNELS = 4
+WAIT_MAX_CHANNELS = 2
+# Files larger than this are sent with the system scp when available
+SCP_THRESHOLD = 10 * 1024 * 1024
+_SCP = shutil.which("scp")
+# Opt-in OpenSSH connection sharing for the ssh/scp subprocesses: the first one
+# opens a master connection that later calls reuse for ControlPersist seconds.
+# Enabled per machine with auth "multiplex": true, or for every machine with
+# XESPRESSO_SSH_MULTIPLEX=1; otherwise the user's ssh_config applies unchanged.
+SSH_MULTIPLEX = os.getenv("XESPRESSO_SSH_MULTIPLEX") == "1"
+_SSH_MULTIPLEX_OPTIONS = [
+    "-o", "ControlMaster=auto",
+    "-o", "ControlPath=~/.ssh/cm-%r@%h:%p",
+    "-o", "ControlPersist=120s",
+]
+try:
+    _LOCAL_USER = getpass.getuser()
+except (OSError, KeyError):
+    _LOCAL_USER = None
+# Local buffer size for streamed uploads and downloads
+TRANSFER_BUFFER_SIZE = 1 << 20
+# Payload of each SFTP write request (paramiko's default is 32 KiB). OpenSSH's
+# sftp-server accepts messages up to 256 KiB, headers included.
+SFTP_WRITE_REQUEST_SIZE = 255 * 1024
+
+class _HashingReader:
+    """File wrapper that feeds every chunk read from it into a hash object."""
+
+    def __init__(self, fileobj, digest):
+        self.fileobj = fileobj
+        self.name = fileobj.name
+        self.digest = digest
+
+    def read(self, size=-1):
+        data = self.fileobj.read(size)
+        self.digest.update(data)
+        return data
+
+def _close_session(client, sftp_channels):
+    """
+    Closes an SSH client and its SFTP channels.
+
+    Registered with weakref.finalize so that sessions are released even if a
+    RemoteAuth is dropped without close(); it receives the connection
+    objects rather than the instance, so nothing is resurrected.
+    """
+    for sftp in sftp_channels:
+        sftp.close()
+    client.close()
+
+def _drain(recv, buffer):
+    """Appends the data returned by a blocking channel `recv` to `buffer` until EOF."""
+    for data in iter(lambda: recv(TRANSFER_BUFFER_SIZE), b""):
+        buffer.extend(data)
+
+@lru_cache(maxsize=None)
+def _paramiko():
+    """
+    Imports paramiko on first use.
+
+    paramiko pulls in cryptography/OpenSSL, which noticeably slows down
+    importing the schedulers even for purely local runs.
+    """
+    import paramiko
+    return paramiko
+
+# Process-wide session pool for RemoteAuth.get(), least recently used first
+_POOL = OrderedDict()
+_POOL_LOCK = threading.Lock()
+
+def _evict_idle():
+    """
+    Removes least recently used idle sessions while the pool is over
+    MAX_POOLED_SESSIONS and returns them (to be closed outside the lock).
+    Sessions still checked out are never evicted. Caller holds _POOL_LOCK.
+    """
+    excess = len(_POOL) - MAX_POOLED_SESSIONS
+    evicted = []
+    for key, remote in list(_POOL.items()):
+        if excess <= 0:
+            break
+        if remote._refs == 0:
+            del _POOL[key]
+            evicted.append(remote)
+            excess -= 1
+    return evicted
 
 class RemoteAuth:
     """
@@ -38,7 +150,7 @@ class RemoteAuth:
     - Persistent SSH and SFTP sessions
     - Remote command execution
     - File transfer (send/retrieve)
-    - Remote SHA256 checksum validation
+    - Remote SHA256 (or BLAKE3, via b3sum) checksum validation
 
     Args:
         username (str): SSH login username.
@@ -54,104 +166,621 @@ class RemoteAuth:
         self.port = auth_config.get("port", 22)
         self.method = auth_config.get("method", "key")
         self.ssh_key = os.path.expanduser(auth_config.get("ssh_key", "~/.ssh/id_rsa"))
+        self.multiplex = auth_config.get("multiplex", SSH_MULTIPLEX)
         self.client = None
         self.sftp = None
+        self._sftp_channels = []  # All open SFTP channels (self.sftp first)
+        self._idle_sftp = []
+        self._finalizer = None
+        self._refs = 0  # Callers holding this session via get()
+        self._sftp_lock = threading.Lock()
+        self._sftp_slots = threading.BoundedSemaphore(SFTP_MAX_CHANNELS)
+        self._exec_slots = threading.BoundedSemaphore(EXEC_MAX_CHANNELS)
+        self._wait_slots = threading.BoundedSemaphore(WAIT_MAX_CHANNELS)
+        self._ensured_dirs = set()
+        self._remote_commands = {}
+        # Same machine and same account: files can be copied without SSH. A
+        # loopback host on another port is usually a tunnel to a remote
+        # cluster, so it keeps going through SSH.
+        self._is_local = (
+            self.host in ("localhost", "127.0.0.1", "::1", socket.gethostname())
+            and self.port in (None, 22)
+            and self.username == _LOCAL_USER
+        )
 
         if self.method != "key":
             logger.error(f"Unsupported authentication method: {self.method}")
             raise ValueError(f"Unsupported authentication method: {self.method}")
 
+    @classmethod
+    def get(cls, username, host, auth_config):
+        """
+        Returns the process-wide shared session for (username, host, port, ssh_key).
+
+        Every caller asking for the same server reuses one SSH connection
+        instead of opening its own, which keeps well clear of sshd's
+        MaxStartups limit when many calculations are submitted at once.
+        Each call checks the session out; pair it with release() once done.
+        At most MAX_POOLED_SESSIONS are kept: when a new server is added, the
+        least recently used sessions that nobody holds are closed. The
+        connection itself is opened lazily, on first use.
+
+        Args:
+            username (str): SSH login username.
+            host (str): Remote machine hostname or IP.
+            auth_config (dict): As for RemoteAuth().
+
+        Returns:
+            RemoteAuth: The shared instance.
+        """
+        key = (
+            username,
+            host,
+            auth_config.get("port", 22),
+            os.path.expanduser(auth_config.get("ssh_key", "~/.ssh/id_rsa")),
+        )
+        with _POOL_LOCK:
+            remote = _POOL.get(key)
+            if remote is None:
+                remote = _POOL[key] = cls(username, host, auth_config)
+            else:
+                _POOL.move_to_end(key)
+            remote._refs += 1
+            evicted = _evict_idle()
+        for session in evicted:
+            session.close()
+        return remote
+
+    def release(self):
+        """
+        Returns a session obtained from get() to the pool.
+
+        The connection stays open for the next caller; it only becomes
+        eligible for eviction once no caller holds it any more.
+        """
+        with _POOL_LOCK:
+            self._refs = max(0, self._refs - 1)
+            evicted = _evict_idle()
+        for session in evicted:
+            session.close()
+
+    def _local_copy(self, src, dst):
+        """
+        Copies a file directly when the "remote" host is this machine.
+
+        Only absolute paths qualify, since relative SFTP paths resolve
+        against the remote home rather than the current directory. Returns
+        True if the copy was done (shutil.copyfile uses os.sendfile on Linux).
+        """
+        if not (self._is_local and os.path.isabs(src) and os.path.isabs(dst)):
+            return False
+        shutil.copyfile(src, dst)
+        logger.info(f"Copied '{src}' to '{dst}' (local host)")
+        return True
+
+    @classmethod
+    def close_all(cls):
+        """Closes and forgets every session in the process-wide pool."""
+        with _POOL_LOCK:
+            sessions = list(_POOL.values())
+            _POOL.clear()
+        for remote in sessions:
+            if remote.client:
+                remote.close()
+
     def connect(self):
         """Establishes SSH and SFTP sessions if not already connected."""
         if self.client:
             return
         try:
+            # Small SSH packets (commands, SFTP requests) must not wait on Nagle
+            sock = socket.create_connection((self.host, self.port))
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            paramiko = _paramiko()
             self.client = paramiko.SSHClient()
             self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
             self.client.connect(
                 hostname=self.host,
                 port=self.port,
                 username=self.username,
-                key_filename=self.ssh_key
+                key_filename=self.ssh_key,
+                sock=sock
+            )
+            transport = self.client.get_transport()
+            transport.set_keepalive(KEEPALIVE_INTERVAL)
+            self.sftp = paramiko.SFTPClient.from_transport(transport, window_size=SFTP_WINDOW_SIZE)
+            self._sftp_channels = [self.sftp]
+            self._idle_sftp = [self.sftp]
+            self._finalizer = weakref.finalize(
+                self, _close_session, self.client, self._sftp_channels
             )
-            self.sftp = self.client.open_sftp()
             logger.info(f"Connected to {self.username}@{self.host}:{self.port}")
         except Exception as e:
+            if self.client:
+                self.client.close()
+            self.client = None  # So the next call retries instead of reusing a dead client
             msg = f"Failed to connect to {self.username}@{self.host}:{self.port}: {e}"
             logger.error(msg)
             raise RuntimeError(msg)
 
-    def run_command(self, command):
-        """Executes a shell command on the remote host."""
+    def reconnect(self):
+        """
+        Replaces a dropped connection with a new one, in place.
+
+        The RemoteAuth object stays the same, so callers holding it through
+        get() keep a valid checkout and the pool's refcount is unaffected.
+        """
+        if self.client:
+            self.close()
+        self.connect()
+
+    def is_active(self):
+        """Returns True if the underlying SSH transport is still usable."""
+        if not self.client:
+            return False
+        transport = self.client.get_transport()
+        return transport is not None and transport.is_active()
+
+    @contextmanager
+    def _channel(self):
+        """
+        Checks out an SFTP channel for the duration of one transfer.
+
+        A single SFTP channel cannot serve concurrent requests from several
+        threads, so when all open channels are busy another one is opened on
+        the same SSH transport (no new TCP connection or authentication).
+        At most SFTP_MAX_CHANNELS are in use at once; further callers wait
+        for one to be returned.
+        """
+        with self._sftp_slots:
+            self.connect()
+            with self._sftp_lock:
+                sftp = self._idle_sftp.pop() if self._idle_sftp else None
+            if sftp is None:
+                sftp = _paramiko().SFTPClient.from_transport(
+                    self.client.get_transport(), window_size=SFTP_WINDOW_SIZE
+                )
+                with self._sftp_lock:
+                    self._sftp_channels.append(sftp)
+            try:
+                yield sftp
+            finally:
+                with self._sftp_lock:
+                    self._idle_sftp.append(sftp)
+
+    def run_command(self, command, input_data=None, with_status=False, long_running=False):
+        """
+        Executes a shell command on the remote host.
+
+        stdout is read here and stderr on a helper thread, both with blocking
+        reads: a command writing a lot to one stream cannot stall while the
+        other is being read, and a long-running command (e.g. a wait on a
+        SLURM job) costs no polling. Each stream is decoded once at the end.
+
+        Args:
+            command (str): Shell command to execute.
+            input_data (str or bytes, optional): Data written to the command's
+                stdin before it is closed (e.g. a script consumed by `cat >`).
+            with_status (bool): Also return the command's exit status.
+            long_running (bool): The command may run for hours. It then
+                takes one of the WAIT_MAX_CHANNELS channels instead of an
+                exec slot, so transfers and short commands are never held
+                up; if none is free it fails at once instead of waiting.
+
+        Returns:
+            tuple: (stdout, stderr) output strings, or (stdout, stderr,
+            exit_status) if `with_status`.
+
+        Raises:
+            RuntimeError: If the command cannot be run; connection and
+                paramiko errors are reported this way too.
+        """
+        slots = self._wait_slots if long_running else self._exec_slots
+        if not slots.acquire(blocking=not long_running):
+            raise RuntimeError(f"No free channel for a long-running command on {self.host}")
         try:
             self.connect()
-            stdin, stdout, stderr = self.client.exec_command(command)
-            return stdout.read().decode(), stderr.read().decode()
+            channel = self.client.get_transport().open_session()
+            try:
+                channel.exec_command(command)
+                if input_data is not None:
+                    if isinstance(input_data, str):
+                        input_data = input_data.encode()
+                    channel.sendall(input_data)
+                channel.shutdown_write()
+                stdout, stderr = bytearray(), bytearray()
+                stderr_reader = threading.Thread(
+                    target=_drain, args=(channel.recv_stderr, stderr), daemon=True
+                )
+                stderr_reader.start()
+                _drain(channel.recv, stdout)
+                stderr_reader.join()
+                status = channel.recv_exit_status()
+            finally:
+                # Also on errors and interrupts, so no channel outlives its slot
+                channel.close()
         except Exception as e:
             msg = f"Failed to execute remote command '{command}': {e}"
             logger.error(msg)
             raise RuntimeError(msg)
+        finally:
+            slots.release()
+        if with_status:
+            return stdout.decode(), stderr.decode(), status
+        return stdout.decode(), stderr.decode()
+
+    def makedirs(self, *remote_dirs):
+        """
+        Creates remote directories (and parents) once per session.
+
+        All directories not yet created through this session are made by a
+        single `mkdir -p` exec, so preparing a whole tree costs one
+        round-trip; repeated submissions into the same tree cost none.
+
+        Args:
+            *remote_dirs (str): Directories to create on the remote host.
+        """
+        missing = sorted(set(remote_dirs) - self._ensured_dirs)
+        if not missing:
+            return
+        stdout, stderr = self.run_command("mkdir -p -- " + " ".join(shlex.quote(d) for d in missing))
+        if stderr:
+            msg = f"Failed to create remote directories {missing}: {stderr.strip()}"
+            logger.error(msg)
+            raise RuntimeError(msg)
+        self._ensured_dirs.update(missing)
 
-    def send_file(self, local_path, remote_path):
-        """Transfers a file to the remote host."""
+    def send_file(self, local_path, remote_path, confirm=True):
+        """
+        Transfers a file to the remote host.
+
+        The file is streamed over SFTP with pipelined writes through a 1 MiB
+        read buffer. Files above SCP_THRESHOLD go through the system `scp`
+        instead (see send_file_scp), falling back to SFTP if that fails.
+        When the host is this machine and account, the file is copied locally.
+
+        Args:
+            local_path (str): File to upload.
+            remote_path (str): Destination path on the remote host.
+            confirm (bool): See send_fileobj().
+        """
         try:
-            self.connect()
-            self.sftp.put(local_path, remote_path)
+            if self._local_copy(os.path.abspath(local_path), remote_path):
+                return
+        except OSError as e:
+            msg = f"Failed to send file '{local_path}' to '{remote_path}': {e}"
+            logger.error(msg)
+            raise RuntimeError(msg)
+        if (
+            _SCP
+            and shlex.quote(remote_path) == remote_path
+            and os.path.getsize(local_path) > SCP_THRESHOLD
+        ):
+            try:
+                return self.send_file_scp(local_path, remote_path)
+            except RuntimeError as e:
+                logger.warning(f"{e}; retrying over SFTP")
+        try:
+            with open(local_path, "rb", buffering=TRANSFER_BUFFER_SIZE) as f:
+                self._putfo(f, remote_path, os.fstat(f.fileno()).st_size, confirm)
             logger.info(f"Sent file '{local_path}' to '{remote_path}'")
         except Exception as e:
             msg = f"Failed to send file '{local_path}' to '{remote_path}': {e}"
             logger.error(msg)
             raise RuntimeError(msg)
 
+    def send_file_scp(self, local_path, remote_path):
+        """
+        Transfers a file with the system `scp`, compressed on the wire.
+
+        Bulk copies through OpenSSH are considerably faster than paramiko's
+        SFTP. With multiplexing enabled (see SSH_MULTIPLEX), the OpenSSH
+        master connection is shared between calls, so repeated uploads
+        authenticate only once.
+        Host-key checking follows the user's ssh_config; BatchMode only makes
+        scp fail instead of prompting, and send_file then falls back to SFTP.
+
+        Raises:
+            RuntimeError: If scp exits with an error.
+        """
+        cmd = [
+            "scp", "-q", "-C",
+            "-o", "BatchMode=yes",
+            *(_SSH_MULTIPLEX_OPTIONS if self.multiplex else []),
+            "-i", self.ssh_key,
+            "-P", str(self.port),
+            local_path,
+            f"{self.username}@{self.host}:{remote_path}",
+        ]
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        if result.returncode != 0:
+            msg = f"scp failed to send '{local_path}' to '{remote_path}': {result.stderr.strip()}"
+            logger.error(msg)
+            raise RuntimeError(msg)
+        logger.info(f"Sent file '{local_path}' to '{remote_path}' (scp)")
+
+    def send_fileobj(self, fileobj, remote_path, file_size=0, confirm=True):
+        """
+        Streams an open file-like object to the remote host.
+
+        Writes are pipelined (no per-packet acknowledgement wait).
+
+        Args:
+            fileobj (file): Object opened for binary reading.
+            remote_path (str): Destination path on the remote host.
+            file_size (int, optional): Expected size, checked after the upload.
+            confirm (bool): Stat the remote file after the upload to check its
+                size. Callers that verify a checksum afterwards can pass False
+                to save the extra round-trip.
+        """
+        try:
+            self._putfo(fileobj, remote_path, file_size, confirm)
+            logger.info(f"Sent file '{getattr(fileobj, 'name', fileobj)}' to '{remote_path}'")
+        except Exception as e:
+            msg = f"Failed to send file to '{remote_path}': {e}"
+            logger.error(msg)
+            raise RuntimeError(msg)
+
+    def _putfo(self, fileobj, remote_path, file_size, confirm):
+        """
+        Like SFTPClient.putfo(), but with SFTP_WRITE_REQUEST_SIZE writes.
+
+        Larger requests mean fewer SFTP messages (and acknowledgements) per
+        file; writes are pipelined, so none of them waits for a round-trip.
+
+        Raises:
+            IOError: If `confirm` and the remote size differs from `file_size`.
+        """
+        with self._channel() as sftp:
+            with sftp.open(remote_path, "wb") as remote_file:
+                remote_file.set_pipelined(True)
+                remote_file.MAX_REQUEST_SIZE = SFTP_WRITE_REQUEST_SIZE
+                shutil.copyfileobj(fileobj, remote_file, TRANSFER_BUFFER_SIZE)
+            if confirm and file_size:
+                size = sftp.stat(remote_path).st_size
+                if size != file_size:
+                    raise IOError(f"size mismatch in put! {size} != {file_size}")
+
+    def send_file_hashed(self, local_path, remote_path, hasher=hashlib.sha256, confirm=True):
+        """
+        Uploads a file and returns the hex digest of the bytes sent.
+
+        The digest is computed from the same stream handed to SFTP, so the
+        file is read from disk only once.
+
+        Args:
+            local_path (str): File to upload.
+            remote_path (str): Destination path on the remote host.
+            hasher (callable): Hash constructor (default: hashlib.sha256).
+            confirm (bool): See send_fileobj().
+
+        Returns:
+            str: Hex digest of the local file.
+        """
+        digest = hasher()
+        with open(local_path, "rb", buffering=TRANSFER_BUFFER_SIZE) as f:
+            self.send_fileobj(_HashingReader(f, digest), remote_path, os.fstat(f.fileno()).st_size, confirm)
+        return digest.hexdigest()
+
+    def send_tar(self, local_paths, remote_dir):
+        """
+        Uploads several files into one remote directory as a single tar stream.
+
+        The archive is piped into `tar xf -` on one exec channel, so N small
+        files cost a single round-trip instead of an SFTP open/close each.
+
+        Args:
+            local_paths (list[str]): Files to upload, stored under their basenames.
+            remote_dir (str): Existing destination directory on the remote host.
+        """
+        local_paths = list(local_paths)
+        try:
+            if self._is_local and os.path.isabs(remote_dir):
+                for local_path in local_paths:
+                    shutil.copyfile(local_path, os.path.join(remote_dir, os.path.basename(local_path)))
+                logger.info(f"Copied {len(local_paths)} files to '{remote_dir}' (local host)")
+                return
+            with self._exec_slots:
+                self.connect()
+                stdin, stdout, stderr = self.client.exec_command(f"tar xf - -C {shlex.quote(remote_dir)}")
+                with tarfile.open(fileobj=stdin, mode="w|", bufsize=TRANSFER_BUFFER_SIZE) as tar:
+                    for local_path in local_paths:
+                        tar.add(local_path, arcname=os.path.basename(local_path))
+                stdin.channel.shutdown_write()
+                errors = stderr.read().decode()
+                status = stdout.channel.recv_exit_status()
+        except Exception as e:
+            msg = f"Failed to send files to '{remote_dir}': {e}"
+            logger.error(msg)
+            raise RuntimeError(msg)
+        if status != 0:
+            msg = f"Remote tar failed to unpack into '{remote_dir}': {errors.strip()}"
+            logger.error(msg)
+            raise RuntimeError(msg)
+        logger.info(f"Sent {len(local_paths)} files to '{remote_dir}' (tar)")
+
     def retrieve_file(self, remote_path, local_path):
-        """Retrieves a file from the remote host."""
+        """
+        Retrieves a file from the remote host.
+
+        All read requests are issued up front (prefetch) so large outputs
+        stream at link bandwidth rather than one round-trip per block. When
+        the host is this machine and account, the file is copied locally.
+        """
         try:
-            self.connect()
-            self.sftp.get(remote_path, local_path)
+            if self._local_copy(remote_path, os.path.abspath(local_path)):
+                return
+            with self._channel() as sftp, sftp.open(remote_path, "rb") as remote_file:
+                remote_file.prefetch()
+                with open(local_path, "wb") as local_file:
+                    shutil.copyfileobj(remote_file, local_file, TRANSFER_BUFFER_SIZE)
             logger.info(f"Retrieved file '{remote_path}' to '{local_path}'")
         except Exception as e:
             msg = f"Failed to retrieve file '{remote_path}' to '{local_path}': {e}"
             logger.error(msg)
             raise RuntimeError(msg)
 
+    def retrieve_tar(self, pairs):
+        """
+        Retrieves several files through a single `tar cf -` stream.
+
+        One exec channel carries every file, avoiding an SFTP open, prefetch
+        and close per file. On this machine and account the files are
+        copied locally instead.
+
+        Args:
+            pairs (list[tuple[str, str]]): (remote_path, local_path) pairs.
+
+        Raises:
+            RuntimeError: If the command fails or any file is missing.
+        """
+        pairs = list(pairs)
+        if self._is_local or len(pairs) == 1:
+            for remote_path, local_path in pairs:
+                self.retrieve_file(remote_path, local_path)
+            return
+        # tar stores the paths without their leading "/"
+        wanted = {posixpath.normpath(remote_path).lstrip("/"): local_path for remote_path, local_path in pairs}
+        paths = " ".join(shlex.quote(remote_path) for remote_path, _ in pairs)
+        try:
+            with self._exec_slots:
+                self.connect()
+                stdin, stdout, stderr = self.client.exec_command(f"tar cf - {paths}")
+                stdin.close()
+                with tarfile.open(fileobj=stdout, mode="r|", bufsize=TRANSFER_BUFFER_SIZE) as tar:
+                    for member in tar:
+                        local_path = wanted.pop(posixpath.normpath(member.name), None)
+                        if local_path is None or not member.isfile():
+                            continue
+                        with open(local_path, "wb") as local_file:
+                            shutil.copyfileobj(tar.extractfile(member), local_file, TRANSFER_BUFFER_SIZE)
+                errors = stderr.read().decode()
+                stdout.channel.recv_exit_status()
+        except Exception as e:
+            msg = f"Failed to retrieve files from {self.host}: {e}"
+            logger.error(msg)
+            raise RuntimeError(msg)
+        if wanted:
+            msg = f"Failed to retrieve {', '.join(sorted(wanted))}: {errors.strip()}"
+            logger.error(msg)
+            raise RuntimeError(msg)
+        logger.info(f"Retrieved {len(pairs)} files from {self.host} (tar)")
+
+    def stat(self, remote_path):
+        """
+        Returns the SFTP attributes of a remote file, or None if it does not exist.
+        """
+        try:
+            with self._channel() as sftp:
+                return sftp.stat(remote_path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            msg = f"Failed to stat remote file '{remote_path}': {e}"
+            logger.error(msg)
+            raise RuntimeError(msg)
+
     def sha256(self, remote_path):
         """Computes SHA256 checksum of a file on the remote host."""
+        digest = self.sha256_many([remote_path])[remote_path]
+        if digest is None:
+            msg = f"Failed to compute SHA256 for '{remote_path}'"
+            logger.error(msg)
+            raise RuntimeError(msg)
+        return digest
+
+    def has_command(self, name):
+        """
+        Returns True if `name` is available on the remote PATH (cached per session).
+        """
+        if name not in self._remote_commands:
+            stdout, _ = self.run_command(f"command -v {shlex.quote(name)}")
+            self._remote_commands[name] = bool(stdout.strip())
+        return self._remote_commands[name]
+
+    def checksum_many(self, remote_paths, tool="sha256sum"):
+        """
+        Computes checksums of several remote files in a single SSH round-trip.
+
+        Args:
+            remote_paths (list[str]): Paths of the files on the remote host.
+            tool (str): Remote checksum utility with coreutils-style output,
+                e.g. "sha256sum" or "b3sum".
+
+        Returns:
+            dict: Maps each remote path to its hex digest, or None if the file
+            could not be hashed.
+        """
+        digests = dict.fromkeys(remote_paths)
+        if not remote_paths:
+            return digests
         try:
             self.connect()
-            cmd = f"sha256sum {remote_path}"
+            cmd = f"{tool} -- " + " ".join(shlex.quote(p) for p in remote_paths)
             stdout, stderr = self.run_command(cmd)
-            if stderr:
-                raise RuntimeError(f"Remote error: {stderr.strip()}")
-            return stdout.strip().split()[0]
         except Exception as e:
-            msg = f"Failed to compute SHA256 for '{remote_path}': {e}"
+            msg = f"Failed to compute checksums for {len(remote_paths)} remote files: {e}"
             logger.error(msg)
             raise RuntimeError(msg)
+        if stderr:
+            logger.warning(f"Remote {tool} reported: {stderr.strip()}")
+        for line in stdout.splitlines():
+            digest, _, path = line.partition("  ")
+            if path in digests:
+                digests[path] = digest
+        return digests
+
+    def sha256_many(self, remote_paths):
+        """Computes SHA256 checksums of several remote files in one round-trip."""
+        return self.checksum_many(remote_paths, "sha256sum")
 
     def close(self):
         """Closes SSH and SFTP sessions."""
         try:
-            if self.sftp:
-                self.sftp.close()
-            if self.client:
-                self.client.close()
+            if self._finalizer is not None:
+                self._finalizer()  # Runs _close_session at most once
+                self._finalizer = None
+            self.sftp = None
+            self._sftp_channels = []
+            self._idle_sftp = []
+            self.client = None
+            self._ensured_dirs.clear()
+            self._remote_commands.clear()
             logger.info(f"Closed session with {self.username}@{self.host}")
         except Exception as e:
             msg = f"Failed to close remote session: {e}"
             logger.error(msg)
             raise RuntimeError(msg)
 
+atexit.register(RemoteAuth.close_all)
+
 # 🔧 Auxiliar functions
 
 def generate_ssh_key(private_key_path: str):
     """
-    Generates a new RSA SSH key pair at the specified path.
+    Generates a new RSA SSH key pair (no passphrase) at the specified path.
+
+    The key has no passphrase so that unattended job submission does not
+    stall on a prompt, and ssh-keygen never reads from the terminal.
 
     Args:
         private_key_path (str): Path to the private key file (e.g. ~/.ssh/id_rsa)
+
+    Raises:
+        RuntimeError: If a private key already exists at that path.
     """
     private_key_path = os.path.expanduser(private_key_path)
-    subprocess.run(["ssh-keygen", "-t", "rsa", "-b", "4096", "-f", private_key_path], check=True)
+    # ssh-keygen would otherwise ask whether to overwrite it
+    if os.path.exists(private_key_path):
+        msg = f"An SSH private key already exists at {private_key_path}"
+        logger.error(msg)
+        raise RuntimeError(msg)
+    subprocess.run(
+        ["ssh-keygen", "-q", "-t", "rsa", "-b", "4096", "-N", "", "-f", private_key_path],
+        check=True,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+    )
     print(f"✅ SSH key pair created at {private_key_path} and {private_key_path}.pub")
     logger.info(f"SSH key pair generated at {private_key_path}")
 
@@ -164,13 +793,28 @@ def install_ssh_key(username: str, host: str, public_key_path: str, port: int =
         host (str): Remote host IP or domain.
         public_key_path (str): Path to the public key file.
         port (int): SSH port number.
+
+    Raises:
+        RuntimeError: If ssh-copy-id fails; the message carries its stderr.
     """
     public_key_path = os.path.expanduser(public_key_path)
-    subprocess.run(["ssh-copy-id", "-p", str(port), "-i", public_key_path, f"{username}@{host}"], check=True)
+    # Password prompts go through the terminal; the progress chatter is only shown on failure
+    try:
+        subprocess.run(
+            ["ssh-copy-id", "-p", str(port), "-i", public_key_path, f"{username}@{host}"],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+    except subprocess.CalledProcessError as e:
+        msg = f"ssh-copy-id to {username}@{host}:{port} failed: {e.stderr.strip()}"
+        logger.error(msg)
+        raise RuntimeError(msg) from e
     print(f"🔐 SSH key installed on {username}@{host}:{port}")
     logger.info(f"SSH key installed on {username}@{host}:{port}")
 
-def test_ssh_connection(username: str, host: str, key_path: str = None, port: int = 22):
+def test_ssh_connection(username: str, host: str, key_path: str = None, port: int = 22, multiplex: bool = None):
     """
     Tests SSH connectivity to the remote host.
 
@@ -179,9 +823,15 @@ def test_ssh_connection(username: str, host: str, key_path: str = None, port: in
         host (str): Remote host IP or domain.
         key_path (str, optional): Path to the private key file.
         port (int): SSH port number.
+        multiplex (bool, optional): Open a shared master connection that later
+            scp uploads reuse. Defaults to SSH_MULTIPLEX.
     """
     key_path = os.path.expanduser(key_path) if key_path else None
+    if multiplex is None:
+        multiplex = SSH_MULTIPLEX
     cmd = ["ssh", "-p", str(port), "-o", "PasswordAuthentication=no"]
+    if multiplex:
+        cmd += _SSH_MULTIPLEX_OPTIONS
     if key_path:
         cmd += ["-i", key_path]
     cmd += [f"{username}@{host}", "echo 'Connection successful'"]
@@ -1,5 +1,14 @@
 import logging
 
+class _FastFormatter(logging.Formatter):
+    """Formats records as "[LEVEL] message" without %-style template expansion."""
+
+    def format(self, record):
+        message = f"[{record.levelname}] {record.getMessage()}"
+        if record.exc_info:
+            message = f"{message}\n{self.formatException(record.exc_info)}"
+        return message
+
 def get_logger(name: str = "xespresso", level: int = logging.INFO) -> logging.Logger:
     """
     Returns a reusable logger instance with stream output.
@@ -16,8 +25,9 @@ def get_logger(name: str = "xespresso", level: int = logging.INFO) -> logging.Lo
 
     if not logger.hasHandlers():
         handler = logging.StreamHandler()
-        formatter = logging.Formatter("[%(levelname)s] %(message)s")
-        handler.setFormatter(formatter)
+        handler.setFormatter(_FastFormatter())
         logger.addHandler(handler)
+        # Own handler attached: don't also emit through handlers added to root later
+        logger.propagate = False
 
     return logger
@@ -20,31 +20,69 @@ create_machine(preset_path="/path/to/preset.json")  # Load preset automatically
 """
 
 import os
-import json
 from xespresso.utils.auth import generate_ssh_key, install_ssh_key, test_ssh_connection
 from xespresso.utils.machines.config.editor import edit_machine
+from xespresso.utils.machines.config.loader import DEFAULT_CONFIG_PATH, read_json, write_json
 from xespresso.utils.machines.config.presets import list_presets, load_preset
-from xespresso.utils import warnings as warnings
 from xespresso.utils.logging import get_logger
 
 logger = get_logger()
-warnings.apply_custom_format()
 
-DEFAULT_CONFIG_PATH = os.path.expanduser("~/.xespresso/machines.json")
+# Interactive prompts as (key, label, type, fallback); the current value of
+# the key (e.g. from a preset) is offered as the default.
+_GENERAL_PROMPTS = [
+    ("execution", "Execution mode [local/remote]", str.lower, None),
+    ("scheduler", "Scheduler [direct/slurm]", str, None),
+    ("workdir", "Workdir path", str, None),
+]
+_REMOTE_PROMPTS = [
+    ("host", "Remote host", str, ""),
+    ("port", "SSH port", int, 22),
+    ("username", "SSH username", str, ""),
+]
+_RESOURCE_PROMPTS = [
+    ("nodes", "Number of nodes", int, None),
+    ("ntasks-per-node", "Tasks per node", int, None),
+    ("time", "Walltime", str, None),
+    ("partition", "Partition", str, None),
+]
+
+def _ask(label, default, cast=str):
+    """Prompts for a value showing `default`; empty input keeps the default."""
+    value = input(f"{label} [{'' if default is None else default}]: ").strip()
+    return cast(value) if value else default
+
+def _ask_all(prompts, current):
+    """Runs a prompt table in order, taking defaults from the `current` dict."""
+    return {
+        key: _ask(label, current.get(key, fallback), cast)
+        for key, label, cast, fallback in prompts
+    }
+
+def _load_or_init(path):
+    """
+    Returns the parsed config at `path`, or an empty one if the file does not exist.
+
+    Raises:
+        ValueError: If the file exists but is not valid JSON.
+    """
+    try:
+        config = read_json(path)
+    except FileNotFoundError:
+        return {"machines": {}}
+    logger.info(f"Loaded existing config from {path}")
+    config.setdefault("machines", {})
+    return config
 
 def create_machine(path: str = DEFAULT_CONFIG_PATH, preset_path: str = None):
     logger.info("Starting interactive machine configuration.")
     os.makedirs(os.path.dirname(path), exist_ok=True)
 
-    config = {"machines": {}}
-    if os.path.exists(path):
-        try:
-            with open(path) as f:
-                config = json.load(f)
-            logger.info(f"Loaded existing config from {path}")
-        except Exception as e:
-            logger.error(f"Failed to load config: {e}")
-            return
+    try:
+        config = _load_or_init(path)
+    except Exception as e:
+        logger.error(f"Failed to load config: {e}")
+        return
 
     machine_name = input("Machine name (e.g. local_desktop, cluster_a): ").strip()
     if not machine_name:
@@ -79,18 +117,16 @@ def create_machine(path: str = DEFAULT_CONFIG_PATH, preset_path: str = None):
 
     # Load preset from argument
     if preset_path:
-        if os.path.isfile(preset_path):
-            try:
-                with open(preset_path) as f:
-                    preset = json.load(f)
-                machine.update(preset)
-                logger.info(f"Preset loaded from argument: {preset_path}")
-            except Exception as e:
-                print("⚠️ Failed to load preset from argument.")
-                logger.warning(f"Preset load failed: {e}")
-        else:
+        try:
+            preset = read_json(preset_path)
+            machine.update(preset)
+            logger.info(f"Preset loaded from argument: {preset_path}")
+        except (FileNotFoundError, IsADirectoryError):
             print(f"⚠️ Preset path '{preset_path}' not found.")
             logger.warning(f"Invalid preset path: {preset_path}")
+        except Exception as e:
+            print("⚠️ Failed to load preset from argument.")
+            logger.warning(f"Preset load failed: {e}")
 
     # Unified preset input
     available_presets = list_presets()
@@ -111,8 +147,7 @@ def create_machine(path: str = DEFAULT_CONFIG_PATH, preset_path: str = None):
                 logger.warning(f"Preset load failed: {e}")
         elif os.path.isfile(preset_input):
             try:
-                with open(preset_input) as f:
-                    external_preset = json.load(f)
+                external_preset = read_json(preset_input)
                 machine.update(external_preset)
                 logger.info(f"Custom preset loaded from: {preset_input}")
             except Exception as e:
@@ -123,16 +158,13 @@ def create_machine(path: str = DEFAULT_CONFIG_PATH, preset_path: str = None):
             logger.warning(f"Invalid preset input: {preset_input}")
 
     # Interactive prompts
-    machine["execution"] = input(f"Execution mode [local/remote] [{machine['execution']}]: ").strip().lower() or machine["execution"]
-    machine["scheduler"] = input(f"Scheduler [direct/slurm] [{machine['scheduler']}]: ").strip() or machine["scheduler"]
-    machine["workdir"] = input(f"Workdir path [{machine['workdir']}]: ").strip() or machine["workdir"]
+    machine.update(_ask_all(_GENERAL_PROMPTS, machine))
 
     if machine["execution"] == "remote":
-        machine["host"] = input(f"Remote host [{machine.get('host', '')}]: ").strip() or machine.get("host", "")
-        machine["port"] = int(input(f"SSH port [22]: ").strip() or machine.get("port", 22))
-        machine["username"] = input(f"SSH username [{machine.get('username', '')}]: ").strip() or machine.get("username", "")
+        machine.update(_ask_all(_REMOTE_PROMPTS, machine))
         ssh_key = input(f"Path to SSH key [~/.ssh/id_rsa.pub]: ").strip() or "~/.ssh/id_rsa.pub"
         ssh_key = os.path.expanduser(ssh_key)
+        private_key = ssh_key[:-len(".pub")] if ssh_key.endswith(".pub") else ssh_key
 
         if not os.path.isfile(ssh_key):
             logger.warning(f"SSH key not found at {ssh_key}")
@@ -140,8 +172,8 @@ def create_machine(path: str = DEFAULT_CONFIG_PATH, preset_path: str = None):
             create_key = input("Generate new SSH key pair now? [y/N]: ").strip().lower()
             if create_key == "y":
                 try:
-                    generate_ssh_key(ssh_key.replace(".pub", ""))
-                    logger.info(f"SSH key generated at {ssh_key.replace('.pub', '')}")
+                    generate_ssh_key(private_key)
+                    logger.info(f"SSH key generated at {private_key}")
                     print("✅ Key created.")
                     install = input("Install this key on the remote server now? [y/N]: ").strip().lower()
                     if install == "y":
@@ -154,7 +186,7 @@ def create_machine(path: str = DEFAULT_CONFIG_PATH, preset_path: str = None):
             logger.info(f"Using existing SSH key: {ssh_key}")
             test = input("Test SSH connectivity with this key? [y/N]: ").strip().lower()
             if test == "y":
-                success = test_ssh_connection(machine["username"], machine["host"], ssh_key.replace(".pub", ""), machine["port"])
+                success = test_ssh_connection(machine["username"], machine["host"], private_key, machine["port"])
                 if success:
                     print("✅ SSH key is already installed and working.")
                     logger.info("SSH key validated successfully.")
@@ -168,17 +200,7 @@ def create_machine(path: str = DEFAULT_CONFIG_PATH, preset_path: str = None):
 
     if machine["scheduler"] == "slurm":
         print("🧮 Define job resources (press Enter to skip any):")
-        res = machine.get("resources", {})
-        nodes = input(f"Number of nodes [{res.get('nodes', '')}]: ").strip()
-        ntasks = input(f"Tasks per node [{res.get('ntasks-per-node', '')}]: ").strip()
-        time = input(f"Walltime [{res.get('time', '')}]: ").strip()
-        partition = input(f"Partition [{res.get('partition', '')}]: ").strip()
-        machine["resources"] = {
-            "nodes": int(nodes) if nodes else res.get("nodes"),
-            "ntasks-per-node": int(ntasks) if ntasks else res.get("ntasks-per-node"),
-            "time": time if time else res.get("time"),
-            "partition": partition if partition else res.get("partition")
-        }
+        machine["resources"] = _ask_all(_RESOURCE_PROMPTS, machine.get("resources", {}))
 
     if machine["execution"] == "remote":
         nodes = machine["resources"].get("nodes", 1)
@@ -206,8 +228,7 @@ def create_machine(path: str = DEFAULT_CONFIG_PATH, preset_path: str = None):
     config["machines"][machine_name] = machine
 
     try:
-        with open(path, "w") as f:
-            json.dump(config, f, indent=2)
+        write_json(path, config)
         print(f"✅ Machine '{machine_name}' saved to {path}")
         logger.info(f"Machine '{machine_name}' saved successfully.")
     except Exception as e:
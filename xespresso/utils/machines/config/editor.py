@@ -15,15 +15,10 @@ from xespresso.utils.machines.config.edit import edit_machine
 edit_machine("cluster_a")  # Edit an existing machine
 """
 
-import os
-import json
-from xespresso.utils import warnings as warnings
 from xespresso.utils.logging import get_logger
+from xespresso.utils.machines.config.loader import DEFAULT_CONFIG_PATH, read_json, write_json
 
 logger = get_logger()
-warnings.apply_custom_format()
-
-DEFAULT_CONFIG_PATH = os.path.expanduser("~/.xespresso/machines.json")
 
 def edit_machine(machine_name: str, path: str = DEFAULT_CONFIG_PATH):
     """
@@ -33,15 +28,13 @@ def edit_machine(machine_name: str, path: str = DEFAULT_CONFIG_PATH):
     - machine_name (str): Name of the machine to edit
     - path (str): Path to the config file
     """
-    if not os.path.exists(path):
+    try:
+        config = read_json(path)
+        logger.info(f"Loaded config from {path}")
+    except FileNotFoundError:
         print(f"❌ Config file not found at {path}")
         logger.error(f"Config file not found: {path}")
         return
-
-    try:
-        with open(path) as f:
-            config = json.load(f)
-        logger.info(f"Loaded config from {path}")
     except Exception as e:
         print("❌ Failed to load config file.")
         logger.error(f"Failed to parse config: {e}")
@@ -137,8 +130,7 @@ def edit_machine(machine_name: str, path: str = DEFAULT_CONFIG_PATH):
     # Save
     config["machines"][machine_name] = machine
     try:
-        with open(path, "w") as f:
-            json.dump(config, f, indent=2)
+        write_json(path, config)
         print(f"✅ Machine '{machine_name}' updated in {path}")
         logger.info(f"Machine '{machine_name}' updated successfully.")
     except Exception as e:
@@ -21,25 +21,119 @@ queue = load_machine()  # Loads default machine
 """
 
 import os
+import copy
 import json
+import stat
+import threading
+from functools import lru_cache
 from xespresso.utils import warnings as warnings
 from xespresso.utils.logging import get_logger
 
+# orjson is optional; when installed it parses and serializes config files
+# several times faster than the standard json module.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = get_logger()
-warnings.apply_custom_format()
 
 DEFAULT_CONFIG_PATH = os.path.expanduser("~/.xespresso/machines.json")
 DEFAULT_MACHINE_NAME = "local_desktop"
+DEFAULT_SSH_KEY = os.path.expanduser("~/.ssh/id_rsa")
+
+# Queue fields copied from a machine block, with their defaults
+_QUEUE_DEFAULTS = {
+    "execution": "local",
+    "scheduler": "direct",
+    "use_modules": False,
+    "modules": [],
+    "resources": {},
+    "prepend": "",
+    "postpend": "",
+    "launcher": "mpirun -np {nprocs}",
+    "nprocs": 1,
+}
+
+# Builders of queue["remote_auth"], keyed by the machine's auth method. The
+# key path is stored expanded so that consumers do not have to expand it again.
+_AUTH_BUILDERS = {
+    "key": lambda auth: {
+        "method": "key",
+        "ssh_key": os.path.expanduser(auth.get("ssh_key", DEFAULT_SSH_KEY)),
+        "port": auth.get("port", 22),
+    },
+}
+
+def read_json(path):
+    """
+    Reads and parses a JSON file (with orjson if available).
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If it is not valid JSON.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def write_json(path, obj):
+    """
+    Writes `obj` to `path` as JSON indented by two spaces (with orjson if available).
+
+    The file is replaced atomically (temp file + os.replace), so an
+    interrupted save never leaves a truncated config behind. A symlinked
+    path is resolved first, so the link itself survives the save, and the
+    new file keeps the permission bits of the one it replaces.
+    """
+    if orjson:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        data = json.dumps(obj, indent=2).encode() + b"\n"
+    path = os.path.realpath(path)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        try:
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            pass  # First save: the umask default applies, as with open()
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
 
 def normalize_script_block(block):
     """
     Ensures that script blocks (prepend/postpend) are returned as strings.
-    Accepts either a string or a list of strings.
+    Accepts a string, or a list or tuple of strings.
     """
-    if isinstance(block, list):
+    if isinstance(block, (list, tuple)):
         return "\n".join(block)
     return block or ""
 
+@lru_cache(maxsize=8)
+def _parse_config(config_path, mtime_ns):
+    """
+    Parses a machine config file, memoized on (path, mtime_ns).
+
+    Workflows that load machines for many calculations parse the JSON only
+    once; saving the file changes its mtime and forces a fresh parse. The
+    returned dict is shared, so callers must not mutate it.
+    """
+    config = read_json(config_path)
+    logger.info(f"Loaded config from {config_path}")
+    return config
+
+def _config_mtime(config_path):
+    """Returns the config file's st_mtime_ns, or None if it does not exist."""
+    try:
+        return os.stat(config_path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
 def load_machine(config_path: str = DEFAULT_CONFIG_PATH, machine_name: str = DEFAULT_MACHINE_NAME) -> dict | None:
     """
     Loads and parses a machine configuration block into a queue dictionary.
@@ -53,7 +147,8 @@ def load_machine(config_path: str = DEFAULT_CONFIG_PATH, machine_name: str = DEF
     - queue (dict): Parsed configuration for scheduler and remote execution
     - None: If config file is missing or malformed
     """
-    if not os.path.exists(config_path):
+    mtime_ns = _config_mtime(config_path)
+    if mtime_ns is None:
         warnings.warn(
             f"Machine config file not found at {config_path}.\n"
             f"To create one, run:\n"
@@ -65,42 +160,37 @@ def load_machine(config_path: str = DEFAULT_CONFIG_PATH, machine_name: str = DEF
         return None
 
     try:
-        with open(config_path) as f:
-            config = json.load(f)
-        logger.info(f"Loaded config from {config_path}")
+        config = _parse_config(config_path, mtime_ns)
     except Exception as e:
         logger.error(f"Failed to parse config file: {e}")
         return None
 
     machines = config.get("machines", {})
-    if machine_name not in machines:
+    machine = machines.get(machine_name)
+    if machine is None:
         logger.warning(f"Machine '{machine_name}' not found in config.")
-        print(f"❌ Machine '{machine_name}' not found.")
-        print("🧭 Available machines:")
-        for name in machines:
-            print(f" - {name}")
+        print(
+            f"❌ Machine '{machine_name}' not found.\n"
+            "🧭 Available machines:\n"
+            + "\n".join(f" - {name}" for name in machines)
+        )
         retry = input("Enter a valid machine name or press Enter to cancel: ").strip()
         if retry and retry in machines:
             machine_name = retry
+            machine = machines[machine_name]
             logger.info(f"Retrying with machine: {machine_name}")
         else:
             print("❌ Aborted. No machine loaded.")
             logger.info("User aborted machine selection.")
             return None
 
-    machine = machines[machine_name]
+    # Defaults are merged in before copying: the parsed config is cached and
+    # the default lists/dicts are shared, while callers may modify the queue
+    machine = copy.deepcopy({**_QUEUE_DEFAULTS, **machine})
 
-    queue = {
-        "execution": machine.get("execution", "local"),
-        "scheduler": machine.get("scheduler", "direct"),
-        "use_modules": machine.get("use_modules", False),
-        "modules": machine.get("modules", []),
-        "resources": machine.get("resources", {}),
-        "prepend": normalize_script_block(machine.get("prepend")),
-        "postpend": normalize_script_block(machine.get("postpend")),
-        "launcher": machine.get("launcher", "mpirun -np {nprocs}"),
-        "nprocs": machine.get("nprocs", 1)
-    }
+    queue = {key: machine[key] for key in _QUEUE_DEFAULTS}
+    queue["prepend"] = normalize_script_block(queue["prepend"])
+    queue["postpend"] = normalize_script_block(queue["postpend"])
 
     if queue["execution"] == "local":
         queue["local_dir"] = machine.get("workdir", "./")
@@ -112,15 +202,11 @@ def load_machine(config_path: str = DEFAULT_CONFIG_PATH, machine_name: str = DEF
         auth = machine.get("auth", {})
         method = auth.get("method", "key")
 
-        if method != "key":
+        builder = _AUTH_BUILDERS.get(method)
+        if builder is None:
             logger.error(f"Unsupported authentication method: {method}")
             raise ValueError(f"Unsupported authentication method: {method}")
-
-        queue["remote_auth"] = {
-            "method": "key",
-            "ssh_key": auth.get("ssh_key", "~/.ssh/id_rsa"),
-            "port": auth.get("port", 22)
-        }
+        queue["remote_auth"] = builder(auth)
         queue["remote_dir"] = machine["workdir"]
         logger.info(f"Loaded remote machine: {machine_name}")
 
@@ -136,12 +222,12 @@ def list_machines(config_path: str = DEFAULT_CONFIG_PATH) -> list[str]:
     Returns:
     - list[str]: List of machine names
     """
-    if not os.path.exists(config_path):
+    mtime_ns = _config_mtime(config_path)
+    if mtime_ns is None:
         logger.warning(f"Config file not found at {config_path}")
         return []
     try:
-        with open(config_path) as f:
-            config = json.load(f)
+        config = _parse_config(config_path, mtime_ns)
         return list(config.get("machines", {}).keys())
     except Exception as e:
         logger.error(f"Failed to read machine list: {e}")
@@ -23,12 +23,11 @@ does not interact directly with the user.
 """
 
 import os
-import json
 from xespresso.utils import warnings as warnings
 from xespresso.utils.logging import get_logger
+from xespresso.utils.machines.config.loader import read_json, write_json
 
 logger = get_logger()
-warnings.apply_custom_format()
 
 TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), "..", "templates")
 
@@ -42,11 +41,12 @@ def list_presets():
 def load_preset(name: str) -> dict:
     """Loads a preset by name and returns its dictionary content."""
     path = os.path.join(TEMPLATE_DIR, name + ".json")
-    if not os.path.isfile(path):
-        raise FileNotFoundError(f"Preset '{name}' not found.")
-    with open(path) as f:
-        logger.info(f"Loaded preset: {name}")
-        return json.load(f)
+    try:
+        preset = read_json(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Preset '{name}' not found.") from None
+    logger.info(f"Loaded preset: {name}")
+    return preset
 
 def preset_exists(name: str) -> bool:
     """Checks if a preset exists."""
@@ -58,6 +58,5 @@ def create_preset_from_machine(machine: dict, name: str):
     path = os.path.join(TEMPLATE_DIR, name + ".json")
     if os.path.exists(path):
         warnings.warn(f"Preset '{name}' already exists and will be overwritten.")
-    with open(path, "w") as f:
-        json.dump(machine, f, indent=2)
+    write_json(path, machine)
     logger.info(f"Preset '{name}' created at {path}")
@@ -23,17 +23,26 @@ Example usage:
 """
 
 import os
+import copy
 import json
 import warnings
-
-def custom_warning_format(message, category, filename, lineno, file=None, line=None):
-    return f"{category.__name__}: {message}\n"
-
-warnings.formatwarning = custom_warning_format
+from functools import lru_cache
 
 DEFAULT_CONFIG_PATH = os.path.expanduser("~/.xespresso/machines.json")
 DEFAULT_MACHINE_NAME = "local_desktop"
 
+@lru_cache(maxsize=16)
+def _load_config_file(path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Parses a JSON config file, memoized on (path, mtime_ns, size).
+
+    Repeated load_machine() calls on an unchanged file reuse the parsed dict
+    instead of re-reading it; editing the file changes the key and forces a
+    fresh parse. The returned dict is shared and must not be mutated.
+    """
+    with open(path) as f:
+        return json.load(f)
+
 def load_machine(config_path: str = DEFAULT_CONFIG_PATH,
 		   machine_name: str = DEFAULT_MACHINE_NAME) -> dict | None:
     """
@@ -48,7 +57,9 @@ def load_machine(config_path: str = DEFAULT_CONFIG_PATH,
     - queue (dict): Parsed configuration for scheduler and remote execution
     - None: If config file is missing
     """
-    if not os.path.exists(config_path):
+    try:
+        st = os.stat(config_path)
+    except FileNotFoundError:
         warnings.warn(
             f"Machine config file not found at {config_path}.\n"
             f"To create one, make sure to import and call:\n"
@@ -58,13 +69,13 @@ def load_machine(config_path: str = DEFAULT_CONFIG_PATH,
         )
         return None
 
-    with open(config_path) as f:
-        config = json.load(f)
+    config = _load_config_file(os.path.realpath(config_path), st.st_mtime_ns, st.st_size)
 
     if "machines" not in config or machine_name not in config["machines"]:
         raise KeyError(f"Machine '{machine_name}' not found in config")
 
-    machine = config["machines"][machine_name]
+    # The parsed config is cached and shared; keep the queue independent of it
+    machine = copy.deepcopy(config["machines"][machine_name])
 
     queue = {
         "execution": machine.get("execution", "local"),
@@ -116,10 +127,10 @@ def create_machine(path: str = DEFAULT_CONFIG_PATH):
     os.makedirs(os.path.dirname(path), exist_ok=True)
 
     # Load existing config if present
-    if os.path.exists(path):
+    try:
         with open(path) as f:
             config = json.load(f)
-    else:
+    except FileNotFoundError:
         config = {"machines": {}}
 
     machine_name = input("Machine name (e.g. local_desktop, cluster_a): ").strip()
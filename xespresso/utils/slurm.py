@@ -1,19 +1,147 @@
 # xespresso/utils/slurm.py
 
+import re
 import shutil
 import subprocess
 import os
+from functools import lru_cache
 from xespresso.config import VERBOSE_ERRORS
 
+# Job ID in sbatch output ("Submitted batch job 12345"), compiled once
+_SLURM_JOBID_RE = re.compile(r"Submitted batch job (\d+)")
+
+# Seconds to wait for the availability probes before treating SLURM as down
+SLURM_CHECK_TIMEOUT = 2
+SLURM_PING_TIMEOUT = 10
+
+def parse_job_id(output):
+    """
+    Extracts the job ID from the output of `sbatch`.
+
+    Args:
+        output (str): Standard output of the sbatch command.
+
+    Returns:
+        str or None: The job ID, or None if the output does not contain one.
+    """
+    match = _SLURM_JOBID_RE.search(output)
+    return match.group(1) if match else None
+
+def _raise_slurm_error(msg):
+    """
+    Raises RuntimeError(msg), hiding the chained traceback unless VERBOSE_ERRORS is set.
+
+    Inside an except block the handled subprocess error would otherwise be
+    chained onto the report.
+    """
+    if VERBOSE_ERRORS:
+        raise RuntimeError(msg)
+    raise RuntimeError(msg) from None
+
+@lru_cache(maxsize=None)
+def _pyslurm():
+    """
+    Imports the optional pyslurm bindings on first use.
+
+    Only the strict controller check needs them, and pyslurm fails to load
+    (ImportError or OSError) when it was built against another libslurm,
+    so the import must not happen when xespresso itself is imported.
+
+    Returns:
+        module or None: pyslurm, or None if it is missing or unusable.
+    """
+    try:
+        import pyslurm
+    except Exception:
+        return None
+    return pyslurm
+
+def _ping_controller():
+    """
+    Checks whether the SLURM controller (slurmctld) answers.
+
+    Uses the pyslurm bindings when available, which pings in-process instead
+    of forking 'scontrol ping'. Any pyslurm failure (missing config API,
+    library mismatch, failed RPC) falls back to 'scontrol ping'.
+
+    Returns:
+        bool: True if the controller responded.
+    """
+    pyslurm = _pyslurm()
+    if pyslurm is not None:
+        try:
+            pyslurm.config().get()
+            return True
+        except Exception:
+            pass
+
+    try:
+        subprocess.run(
+            ["scontrol", "ping"],
+            check=True,
+            timeout=SLURM_PING_TIMEOUT,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+        return False
+    return True
+
+@lru_cache(maxsize=2)
+def _check_slurm_cached(strict):
+    """
+    Runs the SLURM checks of check_slurm_available(); `strict` adds the
+    controller ping.
+
+    Memoized so that 'sbatch' is looked up and the controller probed only once
+    per process. lru_cache does not store exceptions, so only success is
+    cached and an unavailable SLURM is re-checked on the next call.
+    """
+    if shutil.which("sbatch") is None:
+        msg = (
+            "SLURM scheduler requested but 'sbatch' command not found.\n"
+            "Please install SLURM or use 'direct' as the scheduler for local execution."
+        )
+        _raise_slurm_error(msg)
+
+    try:
+        subprocess.run(
+            ["sbatch", "--version"],
+            check=True,
+            timeout=SLURM_CHECK_TIMEOUT,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+        msg = (
+            "SLURM scheduler requested but 'sbatch --version' failed.\n"
+            "Please check the SLURM installation or use 'direct' as the scheduler for local execution."
+        )
+        _raise_slurm_error(msg)
+
+    if not strict:
+        return
+
+    if not _ping_controller():
+        msg = (
+            "SLURM is installed but the controller is not responding.\n"
+            "Make sure slurmctld is running and accessible."
+        )
+        _raise_slurm_error(msg)
+
 def check_slurm_available():
     """
     Validates that the SLURM job scheduler is installed and operational on the system.
 
-    This function performs two checks:
+    This function performs the following checks:
     1. Verifies that the 'sbatch' command is available in the system's PATH.
-    2. Confirms that the SLURM controller daemon ('slurmctld') is responsive via 'scontrol ping'.
+    2. Confirms that 'sbatch --version' runs (local only, no controller round-trip).
+    3. In strict mode only, confirms that the SLURM controller daemon ('slurmctld')
+       is responsive, via pyslurm if installed or 'scontrol ping' otherwise.
 
     Behavior:
+    - A successful check is cached for the lifetime of the process; failures are
+      re-checked on the next call.
     - If the environment variable XESPRESSO_FORCE_SCHEDULER is set to '1', all checks are skipped.
     - If VERBOSE_ERRORS is True (via XESPRESSO_VERBOSE_ERRORS), full Python tracebacks will be shown.
       Otherwise, errors are raised cleanly without traceback clutter.
@@ -27,28 +155,10 @@ def check_slurm_available():
 
     Environment Variables:
         XESPRESSO_FORCE_SCHEDULER: Set to '1' to bypass SLURM checks entirely.
+        XESPRESSO_STRICT_SLURM_CHECK: Set to '1' to also ping the controller.
         XESPRESSO_VERBOSE_ERRORS: Set to '1', 'true', or 'yes' to enable full tracebacks on failure.
     """
     if os.getenv("XESPRESSO_FORCE_SCHEDULER") == "1":
         return
 
-    if shutil.which("sbatch") is None:
-        msg = (
-            "SLURM scheduler requested but 'sbatch' command not found.\n"
-            "Please install SLURM or use 'direct' as the scheduler for local execution."
-        )
-        raise RuntimeError(msg) if VERBOSE_ERRORS else RuntimeError(msg) from None
-
-    try:
-        subprocess.run(
-            ["scontrol", "ping"],
-            check=True,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL
-        )
-    except subprocess.CalledProcessError:
-        msg = (
-            "SLURM is installed but the controller is not responding.\n"
-            "Make sure slurmctld is running and accessible."
-        )
-        raise RuntimeError(msg) if VERBOSE_ERRORS else RuntimeError(msg) from None
+    _check_slurm_cached(os.getenv("XESPRESSO_STRICT_SLURM_CHECK") == "1")
@@ -4,7 +4,9 @@ import warnings
 def warn(msg, category=UserWarning):
     warnings.warn(msg, category)
 
+def _custom_warning_format(message, category, filename, lineno, *_):
+    return "\n⚠️ %s in %s:%s\n→ %s\n" % (category.__name__, filename, lineno, message)
+
 def apply_custom_format():
-    warnings.formatwarning = lambda msg, cat, fname, lineno, *_: (
-        f"\n⚠️ {cat.__name__} in {fname}:{lineno}\n→ {msg}\n"
-    )
+    if warnings.formatwarning is not _custom_warning_format:
+        warnings.formatwarning = _custom_warning_format